@@ -12,9 +12,14 @@ from app.api.v1.ws import router as ws_router
 api_router = APIRouter()
 
 # v1 endpoints
-api_router.include_router(health_router, prefix="/v1", tags=["Health"])
-api_router.include_router(sessions_router, prefix="/v1", tags=["Sessions"])
-api_router.include_router(chat_router, prefix="/v1", tags=["Chat"])
-api_router.include_router(ws_router, prefix="/v1", tags=["WebSocket"])
-api_router.include_router(functions_router, prefix="/v1", tags=["Functions"])
-api_router.include_router(models_router, prefix="/v1", tags=["Models"])
+_V1_ROUTERS = (
+    (health_router, "Health"),
+    (sessions_router, "Sessions"),
+    (chat_router, "Chat"),
+    (ws_router, "WebSocket"),
+    (functions_router, "Functions"),
+    (models_router, "Models"),
+)
+
+for _router, _tag in _V1_ROUTERS:
+    api_router.include_router(_router, prefix="/v1", tags=[_tag])
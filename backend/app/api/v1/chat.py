@@ -1,106 +1,122 @@
 """Chat endpoints for sync and structured output (WebSocket handles streaming)."""
 
 import logging
-import uuid
+import secrets
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from app.config import get_settings
+from app.api.routing import ORJSONRoute
+from app.config import Settings
 from app.dependencies import (
     get_history_service,
     get_llm_client,
     get_schema_registry_dep,
-    get_schema_validator,
-    get_session_manager,
+    get_schema_validator_dep,
+    get_settings_dep,
     validate_session,
 )
 from app.models.domain.message import Message
 from app.models.schemas.chat import ChatRequest, ChatResponse
 from app.services.llm.client import VLLMClient
-from app.services.llm.message_builder import MessageBuilder
+from app.services.llm.message_builder import get_history_build_cache
 from app.services.llm.prompts import get_system_prompt
 from app.services.schema.registry import SchemaRegistry
 from app.services.schema.validator import SchemaValidator
 from app.services.session.history import ChatHistoryService
-from app.services.session.manager import SessionManager
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/chat")
+router = APIRouter(prefix="/chat", route_class=ORJSONRoute)
+
+
+async def _prepare_chat_context(
+    request: ChatRequest,
+    session_id: str,
+    history_service: ChatHistoryService,
+    system_prompt: str,
+) -> tuple[Message, list[dict]]:
+    """
+    Build the user message and LLM message list shared by the chat endpoints.
+
+    The user message is not stored here; callers persist it together with
+    the assistant reply. Stateless requests take prior turns from the
+    request body instead of Redis.
+
+    Returns:
+        Tuple of (user_message, llm_messages)
+    """
+    user_message = Message(
+        role="user",
+        content=request.message,
+        session_id=session_id,
+    )
+
+    if request.stateless:
+        prior_messages = [{"role": m.role, "content": m.content} for m in request.prior_messages]
+    else:
+        # Current message is not yet stored
+        history_without_current = await history_service.get_context_messages(session_id)
+        prior_messages = get_history_build_cache().build(session_id, history_without_current)
+
+    # System prompt + history + current message
+    llm_messages = [
+        {"role": "system", "content": system_prompt},
+        *prior_messages,
+        {"role": "user", "content": request.message},
+    ]
+    return user_message, llm_messages
+
+
+async def _keep_user_turn(
+    history_service: ChatHistoryService,
+    session_id: str,
+    user_message: Message,
+    ttl_seconds: int,
+) -> None:
+    """Keep the user's turn in history after the LLM call failed.
+
+    Best effort: a Redis error here is logged so it cannot mask the LLM error.
+    """
+    try:
+        await history_service.append_message(session_id, user_message, ttl_seconds)
+    except Exception as e:
+        logger.error(f"Failed to save user message after LLM error: {e}")
 
 
 @router.post("/sync", response_model=ChatResponse)
 async def chat_sync(
     request: ChatRequest,
     session_id: Annotated[str, Depends(validate_session)],
-    session_manager: Annotated[SessionManager, Depends(get_session_manager)],
     history_service: Annotated[ChatHistoryService, Depends(get_history_service)],
     llm_client: Annotated[VLLMClient, Depends(get_llm_client)],
+    settings: Annotated[Settings, Depends(get_settings_dep)],
 ):
     """
     Send a message and receive complete response (non-streaming).
 
     Alternative to SSE streaming for simpler clients.
     """
-    settings = get_settings()
-    request_id = str(uuid.uuid4())
+    request_id = secrets.token_hex(16)
 
-    # Save user message to history
-    user_message = Message(
-        role="user",
-        content=request.message,
-        session_id=session_id,
-    )
-    await history_service.append_message(
-        session_id,
-        user_message,
-        settings.session_ttl_seconds,
+    user_message, llm_messages = await _prepare_chat_context(
+        request, session_id, history_service, get_system_prompt()
     )
 
-    # Get conversation history
-    history = await history_service.get_context_messages(session_id)
-    history_without_current = history[:-1]
-
-    # Build LLM messages: system prompt + history + current message
-    llm_messages = [{"role": "system", "content": get_system_prompt()}]
-    llm_messages.extend(MessageBuilder.build_messages(history_without_current))
-    llm_messages.append({"role": "user", "content": request.message})
-
     try:
         # Get complete response
         result = await llm_client.chat_completion(
             messages=llm_messages,
             max_tokens=request.max_tokens or settings.vllm_max_tokens,
             temperature=request.temperature or 0.6,
+            cache_salt=session_id,
         )
-
-        # Create and save assistant message
-        assistant_message = Message(
-            role="assistant",
-            content=result["content"],
-            session_id=session_id,
-        )
-        await history_service.append_message(
-            session_id,
-            assistant_message,
-            settings.session_ttl_seconds,
-        )
-
-        # Update session message count
-        await session_manager.increment_message_count(session_id, 2)
-
-        return ChatResponse(
-            request_id=request_id,
-            session_id=session_id,
-            content=result["content"],
-            usage={
-                "prompt_tokens": result["usage"]["prompt_tokens"],
-                "completion_tokens": result["usage"]["completion_tokens"],
-            } if result.get("usage") else None,
-        )
-
     except Exception as e:
         logger.error(f"Chat completion error: {e}")
+        # Keep the user's turn in history even though the LLM call failed
+        if not request.stateless:
+            await _keep_user_turn(
+                history_service, session_id, user_message, settings.session_ttl_seconds
+            )
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail={
@@ -111,16 +127,40 @@ async def chat_sync(
             },
         )
 
+    # Create assistant message
+    assistant_message = Message(
+        role="assistant",
+        content=result["content"],
+        session_id=session_id,
+    )
+    # Save both turns and update session message count in one round-trip
+    if not request.stateless:
+        await history_service.append_and_bump(
+            session_id,
+            [user_message, assistant_message],
+            settings.session_ttl_seconds,
+        )
+
+    return ChatResponse(
+        request_id=request_id,
+        session_id=session_id,
+        content=result["content"],
+        usage={
+            "prompt_tokens": result["usage"]["prompt_tokens"],
+            "completion_tokens": result["usage"]["completion_tokens"],
+        } if result.get("usage") else None,
+    )
+
 
 @router.post("/structured", response_model=ChatResponse)
 async def chat_structured(
     request: ChatRequest,
     session_id: Annotated[str, Depends(validate_session)],
-    session_manager: Annotated[SessionManager, Depends(get_session_manager)],
     history_service: Annotated[ChatHistoryService, Depends(get_history_service)],
     llm_client: Annotated[VLLMClient, Depends(get_llm_client)],
     schema_registry: Annotated[SchemaRegistry, Depends(get_schema_registry_dep)],
-    schema_validator: Annotated[SchemaValidator, Depends(get_schema_validator)],
+    schema_validator: Annotated[SchemaValidator, Depends(get_schema_validator_dep)],
+    settings: Annotated[Settings, Depends(get_settings_dep)],
 ):
     """
     Send a message and receive structured JSON response.
@@ -137,8 +177,7 @@ async def chat_structured(
     - table: Tabular data with headers and rows
     - code: Code generation with language, code, explanation
     """
-    settings = get_settings()
-    request_id = str(uuid.uuid4())
+    request_id = secrets.token_hex(16)
 
     # Validate output_schema is provided
     if not request.output_schema:
@@ -180,29 +219,16 @@ async def chat_structured(
                 },
             )
 
-    # Save user message to history
-    user_message = Message(
-        role="user",
-        content=request.message,
-        session_id=session_id,
-    )
-    await history_service.append_message(
-        session_id,
-        user_message,
-        settings.session_ttl_seconds,
-    )
-
-    # Get conversation history
-    history = await history_service.get_context_messages(session_id)
-    history_without_current = history[:-1]
-
-    # Build LLM messages with schema instruction in system prompt
+    # Build LLM messages with schema instruction in system prompt.
+    # Static base prompt first, per-request schema last, so the shared prefix
+    # stays identical for vLLM's automatic prefix cache.
     schema_instruction = schema_validator.get_schema_instruction(schema)
     system_prompt = get_system_prompt() + "\n\n" + schema_instruction
 
-    llm_messages = [{"role": "system", "content": system_prompt}]
-    llm_messages.extend(MessageBuilder.build_messages(history_without_current))
-    llm_messages.append({"role": "user", "content": request.message})
+    # System + history prefix is built once; retries only replace the final user turn
+    user_message, llm_messages = await _prepare_chat_context(
+        request, session_id, history_service, system_prompt
+    )
 
     # Attempt to get valid structured response with retries
     max_retries = output_schema.max_retries if output_schema.strict else 0
@@ -211,14 +237,18 @@ async def chat_structured(
     validation_errors: list[str] = []
     structured_data = None
     result: dict | None = None
+    # Resolved once; vllm_max_tokens is a computed property
+    max_tokens = request.max_tokens or settings.vllm_max_tokens
+    temperature = request.temperature or 0.6
 
     try:
         for attempt in range(max_retries + 1):
             # Call LLM
             result = await llm_client.chat_completion(
                 messages=llm_messages,
-                max_tokens=request.max_tokens or settings.vllm_max_tokens,
-                temperature=request.temperature or 0.6,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                cache_salt=session_id,
             )
 
             response_content = result["content"]
@@ -250,41 +280,16 @@ async def chat_structured(
                     response_content,
                 )
 
-                # Update messages for retry
-                llm_messages = [{"role": "system", "content": system_prompt}]
-                llm_messages.extend(MessageBuilder.build_messages(history_without_current))
-                llm_messages.append({"role": "user", "content": retry_prompt})
-
-        # Save assistant message (use best response even if validation failed)
-        assistant_message = Message(
-            role="assistant",
-            content=best_response,
-            session_id=session_id,
-        )
-        await history_service.append_message(
-            session_id,
-            assistant_message,
-            settings.session_ttl_seconds,
-        )
-
-        # Update session message count
-        await session_manager.increment_message_count(session_id, 2)
-
-        return ChatResponse(
-            request_id=request_id,
-            session_id=session_id,
-            content=best_response,
-            usage={
-                "prompt_tokens": result["usage"]["prompt_tokens"],
-                "completion_tokens": result["usage"]["completion_tokens"],
-            } if result and result.get("usage") else None,
-            structured_data=structured_data,
-            validation_errors=validation_errors if validation_errors else None,
-            retry_count=retry_count if retry_count > 0 else None,
-        )
+                # Update messages for retry (prefix is left untouched)
+                llm_messages[-1] = {"role": "user", "content": retry_prompt}
 
     except Exception as e:
         logger.error(f"Structured chat error: {e}")
+        # Keep the user's turn in history even though the LLM call failed
+        if not request.stateless:
+            await _keep_user_turn(
+                history_service, session_id, user_message, settings.session_ttl_seconds
+            )
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail={
@@ -295,6 +300,32 @@ async def chat_structured(
             },
         )
 
+    # Save assistant message (use best response even if validation failed)
+    assistant_message = Message(
+        role="assistant",
+        content=best_response,
+        session_id=session_id,
+    )
+    if not request.stateless:
+        await history_service.append_and_bump(
+            session_id,
+            [user_message, assistant_message],
+            settings.session_ttl_seconds,
+        )
+
+    return ChatResponse(
+        request_id=request_id,
+        session_id=session_id,
+        content=best_response,
+        usage={
+            "prompt_tokens": result["usage"]["prompt_tokens"],
+            "completion_tokens": result["usage"]["completion_tokens"],
+        } if result and result.get("usage") else None,
+        structured_data=structured_data,
+        validation_errors=validation_errors if validation_errors else None,
+        retry_count=retry_count if retry_count > 0 else None,
+    )
+
 
 @router.get("/schemas")
 async def list_schemas(
@@ -7,17 +7,26 @@ Provides endpoints for:
 - Viewing execution audit logs
 """
 
+import hashlib
 import logging
+from collections.abc import Callable
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 
-from app.services.functions import FunctionExecutor, get_function_registry
+from app.services.functions import get_function_executor, get_function_registry
+from app.services.functions.registry import FunctionDefinition
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/functions")
 
+# Serialized listing responses keyed by endpoint + query:
+# (registry version, body, etag). Registry changes bump the version.
+_RESPONSE_CACHE_MAX = 128
+_response_cache: dict[tuple, tuple[int, bytes, str]] = {}
+
 
 class FunctionCallRequest(BaseModel):
     """Request to execute a function."""
@@ -90,62 +99,66 @@ class ExecutorStatsResponse(BaseModel):
     registered_functions: int
 
 
-# Global executor instance
-_executor: FunctionExecutor | None = None
+def _to_function_info(func_def: FunctionDefinition) -> FunctionInfo:
+    """Convert a registry definition to API format (trusted data, no validation)."""
+    return FunctionInfo.model_construct(
+        name=func_def.name,
+        description=func_def.description,
+        category=func_def.category,
+        cacheable=func_def.cacheable,
+        parameters=func_def.parameter_info,
+    )
 
 
-def get_executor() -> FunctionExecutor:
-    """Get or create the global function executor."""
-    global _executor
-    if _executor is None:
-        _executor = FunctionExecutor()
-    return _executor
+def _cached_json_response(
+    request: Request,
+    key: tuple,
+    build: Callable[[], BaseModel],
+) -> Response:
+    """Serve a registry-derived response from cache, honouring If-None-Match."""
+    version = get_function_registry().version
+    cached = _response_cache.get(key)
+    if cached is None or cached[0] != version:
+        if len(_response_cache) >= _RESPONSE_CACHE_MAX:
+            _response_cache.clear()
+        body = orjson.dumps(build().model_dump(mode="json"))
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        cached = (version, body, etag)
+        _response_cache[key] = cached
+
+    _, body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("", response_model=FunctionListResponse)
-async def list_functions(category: str | None = None) -> FunctionListResponse:
+async def list_functions(request: Request, category: str | None = None) -> Response:
     """
     List all available functions.
 
     Args:
         category: Optional filter by category (math, datetime, text, utility)
     """
-    registry = get_function_registry()
-    function_names = registry.list_functions(category=category)
-
-    functions = []
-    for name in function_names:
-        func_def = registry.get(name)
-        if func_def:
-            functions.append(FunctionInfo(
-                name=func_def.name,
-                description=func_def.description,
-                category=func_def.category,
-                cacheable=func_def.cacheable,
-                parameters=[
-                    {
-                        "name": p.name,
-                        "type": p.type,
-                        "description": p.description,
-                        "required": p.required,
-                        "default": p.default,
-                        "enum": p.enum,
-                    }
-                    for p in func_def.parameters
-                ],
-            ))
-
-    return FunctionListResponse(
-        functions=functions,
-        total=len(functions),
-    )
+
+    def build() -> FunctionListResponse:
+        registry = get_function_registry()
+        functions = [_to_function_info(f) for f in registry.list_function_defs(category=category)]
+        return FunctionListResponse(
+            functions=functions,
+            total=len(functions),
+        )
+
+    return _cached_json_response(request, ("list", category), build)
 
 
 @router.get("/tools", response_model=ToolDefinitionsResponse)
 async def get_tool_definitions(
+    request: Request,
     include: str | None = None,
     exclude: str | None = None,
-) -> ToolDefinitionsResponse:
+) -> Response:
     """
     Get OpenAI-compatible tool definitions for LLM integration.
 
@@ -153,14 +166,18 @@ async def get_tool_definitions(
         include: Comma-separated list of function names to include
         exclude: Comma-separated list of function names to exclude
     """
-    registry = get_function_registry()
 
-    include_list = include.split(",") if include else None
-    exclude_list = exclude.split(",") if exclude else None
+    def build() -> ToolDefinitionsResponse:
+        registry = get_function_registry()
+
+        include_list = include.split(",") if include else None
+        exclude_list = exclude.split(",") if exclude else None
 
-    tools = registry.get_openai_tools(include=include_list, exclude=exclude_list)
+        tools = registry.get_openai_tools(include=include_list, exclude=exclude_list)
 
-    return ToolDefinitionsResponse(tools=tools)
+        return ToolDefinitionsResponse(tools=tools)
+
+    return _cached_json_response(request, ("tools", include, exclude), build)
 
 
 @router.post("/execute", response_model=FunctionCallResponse)
@@ -171,7 +188,7 @@ async def execute_function(request: FunctionCallRequest) -> FunctionCallResponse
     This is primarily for testing. In production, functions are
     called automatically by the LLM during chat.
     """
-    executor = get_executor()
+    executor = get_function_executor()
 
     try:
         result = await executor.execute(request.name, request.arguments)
@@ -201,7 +218,7 @@ async def get_audit_log(
         limit: Maximum entries to return (default 100)
         function_name: Filter by function name
     """
-    executor = get_executor()
+    executor = get_function_executor()
     entries = executor.get_audit_log(limit=limit, function_name=function_name)
 
     return AuditLogResponse(
@@ -224,7 +241,7 @@ async def get_audit_log(
 @router.get("/stats", response_model=ExecutorStatsResponse)
 async def get_executor_stats() -> ExecutorStatsResponse:
     """Get executor statistics including cache and audit info."""
-    executor = get_executor()
+    executor = get_function_executor()
     stats = executor.get_stats()
 
     return ExecutorStatsResponse(**stats)
@@ -233,7 +250,7 @@ async def get_executor_stats() -> ExecutorStatsResponse:
 @router.post("/cache/clear")
 async def clear_cache() -> dict[str, Any]:
     """Clear the function result cache."""
-    executor = get_executor()
+    executor = get_function_executor()
     count = executor.clear_cache()
 
     return {
@@ -251,20 +268,4 @@ async def get_function(name: str) -> FunctionInfo:
     if not func_def:
         raise HTTPException(status_code=404, detail=f"Function not found: {name}")
 
-    return FunctionInfo(
-        name=func_def.name,
-        description=func_def.description,
-        category=func_def.category,
-        cacheable=func_def.cacheable,
-        parameters=[
-            {
-                "name": p.name,
-                "type": p.type,
-                "description": p.description,
-                "required": p.required,
-                "default": p.default,
-                "enum": p.enum,
-            }
-            for p in func_def.parameters
-        ],
-    )
+    return _to_function_info(func_def)
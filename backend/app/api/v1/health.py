@@ -1,6 +1,8 @@
 """Health check endpoints."""
 
+import asyncio
 import time
+from collections.abc import Awaitable, Callable
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Request
@@ -16,6 +18,19 @@ from app.services.llm.client import VLLMClient
 
 router = APIRouter(prefix="/health")
 
+# Upper bound per dependency so a hung service can't stall the probe
+PROBE_TIMEOUT_SECONDS = 2.0
+
+
+async def _timed_probe(check: Callable[[], Awaitable[bool]]) -> tuple[bool, float]:
+    """Run a health check with a timeout. Returns (healthy, latency_ms)."""
+    start = time.perf_counter()
+    try:
+        healthy = await asyncio.wait_for(check(), timeout=PROBE_TIMEOUT_SECONDS)
+    except Exception:
+        healthy = False
+    return healthy, (time.perf_counter() - start) * 1000
+
 
 @router.get("", response_model=HealthResponse)
 async def health_check():
@@ -42,11 +57,13 @@ async def readiness_check(
     services = {}
     overall_status = "ok"
 
-    # Check Redis
-    start = time.time()
-    redis_healthy = await redis.health_check()
-    redis_latency = (time.time() - start) * 1000
+    # Probe Redis and vLLM concurrently
+    (redis_healthy, redis_latency), (vllm_healthy, vllm_latency) = await asyncio.gather(
+        _timed_probe(redis.health_check),
+        _timed_probe(llm.health_check),
+    )
 
+    # Redis
     if redis_healthy:
         services["redis"] = ServiceHealth(
             status="ok",
@@ -59,11 +76,7 @@ async def readiness_check(
         )
         overall_status = "degraded"
 
-    # Check vLLM
-    start = time.time()
-    vllm_healthy = await llm.health_check()
-    vllm_latency = (time.time() - start) * 1000
-
+    # vLLM
     if vllm_healthy:
         services["vllm"] = ServiceHealth(
             status="ok",
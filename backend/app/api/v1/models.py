@@ -11,6 +11,7 @@ import logging
 from typing import Any
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from app.services.llm.fallback_manager import get_fallback_manager
@@ -72,7 +73,7 @@ class ModelStatusUpdate(BaseModel):
 async def list_models(
     capability: str | None = None,
     status: str | None = None,
-) -> ModelListResponse:
+) -> ORJSONResponse:
     """
     List all available models.
 
@@ -109,41 +110,26 @@ async def list_models(
         status=status_filter,
     )
 
-    model_infos = [
-        ModelInfo(
-            id=m.id,
-            name=m.name,
-            provider=m.provider,
-            capabilities=[c.value for c in m.capabilities],
-            max_tokens=m.max_tokens,
-            context_window=m.context_window,
-            status=m.status.value,
-            priority=m.priority,
-            metrics={
-                "success_rate": m.metrics.success_rate,
-                "avg_latency_ms": m.metrics.avg_latency_ms,
-                "avg_tokens_per_second": m.metrics.avg_tokens_per_second,
-                "total_requests": m.metrics.total_requests,
-            },
-        )
-        for m in models
-    ]
-
-    available_count = sum(1 for m in models if m.status == ModelStatus.AVAILABLE)
-
-    return ModelListResponse(
-        models=model_infos,
-        total=len(model_infos),
-        available=available_count,
-    )
+    # Single pass: build API views and count available models together
+    model_infos = []
+    available_count = 0
+    for m in models:
+        model_infos.append(m.to_dict())
+        available_count += m.status is ModelStatus.AVAILABLE
+
+    # Registry data is trusted; return it directly instead of re-validating
+    return ORJSONResponse({
+        "models": model_infos,
+        "total": len(model_infos),
+        "available": available_count,
+    })
 
 
 @router.get("/stats", response_model=ModelStatsResponse)
-async def get_model_stats() -> ModelStatsResponse:
+async def get_model_stats() -> ORJSONResponse:
     """Get model registry statistics."""
     registry = get_model_registry()
-    stats = registry.get_stats()
-    return ModelStatsResponse(**stats)
+    return ORJSONResponse(registry.get_stats())
 
 
 @router.get("/circuits", response_model=CircuitStatesResponse)
@@ -162,7 +148,7 @@ async def reset_all_circuits() -> dict[str, Any]:
 
 
 @router.get("/{model_id}", response_model=ModelInfo)
-async def get_model(model_id: str) -> ModelInfo:
+async def get_model(model_id: str) -> ORJSONResponse:
     """Get details of a specific model."""
     registry = get_model_registry()
     model = registry.get(model_id)
@@ -170,22 +156,7 @@ async def get_model(model_id: str) -> ModelInfo:
     if not model:
         raise HTTPException(status_code=404, detail=f"Model not found: {model_id}")
 
-    return ModelInfo(
-        id=model.id,
-        name=model.name,
-        provider=model.provider,
-        capabilities=[c.value for c in model.capabilities],
-        max_tokens=model.max_tokens,
-        context_window=model.context_window,
-        status=model.status.value,
-        priority=model.priority,
-        metrics={
-            "success_rate": model.metrics.success_rate,
-            "avg_latency_ms": model.metrics.avg_latency_ms,
-            "avg_tokens_per_second": model.metrics.avg_tokens_per_second,
-            "total_requests": model.metrics.total_requests,
-        },
-    )
+    return ORJSONResponse(model.to_dict())
 
 
 @router.patch("/{model_id}/status")
@@ -1,20 +1,23 @@
 """Session management endpoints."""
 
+import asyncio
 import logging
+import re
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import ORJSONResponse
 
 from app.config import get_settings
 from app.dependencies import (
     get_history_service,
     get_llm_client,
+    get_search_cache,
     get_session_manager,
 )
+from app.models.domain.session import Session
 from app.models.schemas.session import (
-    HistoryMessage,
-    SearchMatch,
-    SearchPagination,
     SearchRequest,
     SearchResponse,
     SemanticSearchMatch,
@@ -31,51 +34,70 @@ from app.models.schemas.session import (
 from app.services.llm.client import VLLMClient
 from app.services.session.history import ChatHistoryService
 from app.services.session.manager import SessionManager
-from app.services.session.search import MessageType, SearchFilter, SearchService
+from app.services.session.search import (
+    MessageType,
+    SearchCache,
+    SearchFilter,
+    get_search_service,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/sessions")
 
+# Search message_type values -> enum, avoids a try/except per request
+_MESSAGE_TYPES = {m.value: m for m in MessageType}
+
+# Whitespace-separated words, iterated lazily for the fallback title
+_WORD_RE = re.compile(r"\S+")
+
+# LLM title prefixes to strip (all the same length)
+_TITLE_PREFIXES = ("Title:", "title:", "TITLE:")
+
 
 def _clean_title(raw_title: str) -> str:
     """Clean LLM-generated title by removing quotes and prefixes."""
     title = raw_title.strip()
 
     # Remove surrounding quotes
-    if (title.startswith('"') and title.endswith('"')) or (
-        title.startswith("'") and title.endswith("'")
-    ):
+    if title[:1] in ('"', "'") and title.endswith(title[0]):
         title = title[1:-1].strip()
 
-    # Remove common prefixes
-    prefixes = ["Title:", "title:", "TITLE:"]
-    for prefix in prefixes:
-        if title.startswith(prefix):
-            title = title[len(prefix) :].strip()
-            break
+    # Remove common prefixes (str.startswith checks the whole tuple in C)
+    if title.startswith(_TITLE_PREFIXES):
+        title = title[len(_TITLE_PREFIXES[0]) :].strip()
 
     # Limit to 50 characters
     if len(title) > 50:
-        # Try to break at word boundary
-        truncated = title[:50]
-        last_space = truncated.rfind(" ")
-        if last_space > 30:
-            title = truncated[:last_space] + "..."
+        # Try to break at a word boundary between 31 and 50 characters
+        last_space = title.rfind(" ", 31, 50)
+        if last_space != -1:
+            title = title[:last_space] + "..."
         else:
-            title = truncated + "..."
+            title = title[:50] + "..."
 
     return title
 
 
 def _truncate_title(content: str) -> str:
     """Generate fallback title using truncation (mirrors frontend logic)."""
-    normalized = " ".join(content.split()).strip()
+    max_length = 40
+
+    # Only the head of the message can end up in the title, so collect
+    # words lazily until the normalized text exceeds max_length instead of
+    # splitting the whole (possibly very long) content
+    words: list[str] = []
+    length = -1
+    for match in _WORD_RE.finditer(content):
+        words.append(match.group())
+        length += len(words[-1]) + 1
+        if length > max_length:
+            break
+    normalized = " ".join(words)
 
     if not normalized:
         return "New conversation"
 
-    max_length = 40
     if len(normalized) <= max_length:
         return normalized
 
@@ -88,6 +110,18 @@ def _truncate_title(content: str) -> str:
     return truncated + "..."
 
 
+def _session_to_response(session: Session) -> SessionResponse:
+    """Build a SessionResponse from a trusted domain Session without re-validating."""
+    return SessionResponse.model_construct(
+        id=session.id,
+        user_id=session.user_id,
+        created_at=session.created_at_datetime,
+        updated_at=session.updated_at_datetime,
+        message_count=session.message_count,
+        metadata=session.metadata,
+    )
+
+
 @router.post("", response_model=SessionResponse, status_code=status.HTTP_201_CREATED)
 async def create_session(
     request: SessionCreate,
@@ -103,14 +137,7 @@ async def create_session(
         metadata=request.metadata,
     )
 
-    return SessionResponse(
-        id=session.id,
-        user_id=session.user_id,
-        created_at=session.created_at_datetime,
-        updated_at=session.updated_at_datetime,
-        message_count=session.message_count,
-        metadata=session.metadata,
-    )
+    return _session_to_response(session)
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
@@ -134,14 +161,7 @@ async def get_session(
             },
         )
 
-    return SessionResponse(
-        id=session.id,
-        user_id=session.user_id,
-        created_at=session.created_at_datetime,
-        updated_at=session.updated_at_datetime,
-        message_count=session.message_count,
-        metadata=session.metadata,
-    )
+    return _session_to_response(session)
 
 
 @router.patch("/{session_id}", response_model=SessionResponse)
@@ -176,20 +196,12 @@ async def update_session_metadata(
 
     await session_manager.update_session(session)
 
-    return SessionResponse(
-        id=session.id,
-        user_id=session.user_id,
-        created_at=session.created_at_datetime,
-        updated_at=session.updated_at_datetime,
-        message_count=session.message_count,
-        metadata=session.metadata,
-    )
+    return _session_to_response(session)
 
 
 @router.get("/{session_id}/history", response_model=SessionHistory)
 async def get_session_history(
     session_id: str,
-    session_manager: Annotated[SessionManager, Depends(get_session_manager)],
     history_service: Annotated[ChatHistoryService, Depends(get_history_service)],
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
@@ -199,9 +211,14 @@ async def get_session_history(
 
     Supports pagination with limit and offset.
     """
-    # Validate session exists
-    session = await session_manager.get_session(session_id)
-    if not session:
+    # Get history page and total count (session existence checked in the same round-trip)
+    page = await history_service.get_history_page(
+        session_id,
+        limit=limit,
+        session_ttl_seconds=get_settings().session_ttl_seconds,
+        offset=offset,
+    )
+    if page is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -211,31 +228,29 @@ async def get_session_history(
                 }
             },
         )
+    messages, total = page
 
-    # Get history
-    messages = await history_service.get_history(session_id, limit=limit, offset=offset)
-    total = await history_service.get_history_count(session_id)
-
-    # Convert to response format
+    # Convert to response format. Stored messages are trusted, so build plain
+    # dicts and skip per-message model validation.
     history_messages = [
-        HistoryMessage(
-            id=msg.id,
-            role=msg.role,
-            content=msg.content,
-            search_results=msg.search_results,
-            search_query=msg.search_query,
-            created_at=msg.created_at_datetime,
-        )
+        {
+            "id": msg.id,
+            "role": msg.role,
+            "content": msg.content,
+            "search_results": msg.search_results,
+            "search_query": msg.search_query,
+            "created_at": msg.created_at_datetime,
+        }
         for msg in messages
     ]
 
-    return SessionHistory(
-        session_id=session_id,
-        messages=history_messages,
-        total=total,
-        limit=limit,
-        offset=offset,
-    )
+    return ORJSONResponse({
+        "session_id": session_id,
+        "messages": history_messages,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+    })
 
 
 @router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -263,15 +278,19 @@ async def delete_session(
 @router.post("/{session_id}/clear-history", status_code=status.HTTP_204_NO_CONTENT)
 async def clear_session_history(
     session_id: str,
-    session_manager: Annotated[SessionManager, Depends(get_session_manager)],
     history_service: Annotated[ChatHistoryService, Depends(get_history_service)],
 ):
     """
     Clear chat history while keeping the session.
     """
-    # Validate session exists
-    session = await session_manager.get_session(session_id)
-    if not session:
+    settings = get_settings()
+
+    # Clear history and reset message count
+    cleared = await history_service.clear_history_and_reset(
+        session_id,
+        settings.session_ttl_seconds,
+    )
+    if not cleared:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -282,12 +301,6 @@ async def clear_session_history(
             },
         )
 
-    await history_service.clear_history(session_id)
-
-    # Reset message count
-    session.message_count = 0
-    await session_manager.update_session(session)
-
 
 @router.post("/{session_id}/history/truncate", response_model=TruncateHistoryResponse)
 async def truncate_session_history(
@@ -355,8 +368,13 @@ async def generate_session_title(
     Uses the first user message to generate a concise title.
     Falls back to truncation if LLM is unavailable.
     """
+    # Load session and first messages from history concurrently
+    session, messages = await asyncio.gather(
+        session_manager.get_session(session_id),
+        history_service.get_history(session_id, limit=2),
+    )
+
     # Validate session exists
-    session = await session_manager.get_session(session_id)
     if not session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -368,8 +386,6 @@ async def generate_session_title(
             },
         )
 
-    # Get first messages from history
-    messages = await history_service.get_history(session_id, limit=2)
     if not messages:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -435,6 +451,7 @@ async def search_messages(
     request: SearchRequest,
     history_service: Annotated[ChatHistoryService, Depends(get_history_service)],
     session_manager: Annotated[SessionManager, Depends(get_session_manager)],
+    search_cache: Annotated[SearchCache, Depends(get_search_cache)],
 ):
     """
     Search across conversation history with filters.
@@ -442,15 +459,36 @@ async def search_messages(
     Supports full-text search, date range filtering, and content type filtering.
     Returns highlighted snippets and relevance scores.
     """
-    search_service = SearchService()
+    search_service = get_search_service()
+
+    # Check the session and the cache concurrently; a missing session 404s
+    # even if a page for it is still cached
+    cache_key = SearchCache.key_for(request.model_dump(mode="json"))
+    if request.session_id:
+        session_exists, (cached, generation) = await asyncio.gather(
+            session_manager.session_exists(request.session_id),
+            search_cache.get(cache_key),
+        )
+        if not session_exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "error": {
+                        "code": "SESSION_NOT_FOUND",
+                        "message": f"Session {request.session_id} not found",
+                    }
+                },
+            )
+    else:
+        cached, generation = await search_cache.get(cache_key)
+
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
     # Build search filter from request
     message_type = MessageType.ALL
     if request.message_type:
-        try:
-            message_type = MessageType(request.message_type.lower())
-        except ValueError:
-            pass
+        message_type = _MESSAGE_TYPES.get(request.message_type.lower(), MessageType.ALL)
 
     filter_ = SearchFilter(
         query=request.query,
@@ -468,25 +506,15 @@ async def search_messages(
     all_messages = []
 
     if request.session_id:
-        # Search within specific session
-        session = await session_manager.get_session(request.session_id)
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail={
-                    "error": {
-                        "code": "SESSION_NOT_FOUND",
-                        "message": f"Session {request.session_id} not found",
-                    }
-                },
-            )
         messages = await history_service.get_history(request.session_id, limit=1000)
         all_messages.extend(messages)
     else:
         # Search across all sessions - get recent sessions
         sessions = await session_manager.list_recent_sessions(limit=50)
-        for session in sessions:
-            messages = await history_service.get_history(session.id, limit=200)
+        histories = await history_service.get_histories_bulk(
+            [session.id for session in sessions], limit=200
+        )
+        for messages in histories:
             all_messages.extend(messages)
 
     # Perform search
@@ -497,35 +525,11 @@ async def search_messages(
         page_size=request.page_size,
     )
 
-    # Convert to response format
-    matches = [
-        SearchMatch(
-            message_id=m.message_id,
-            session_id=m.session_id,
-            role=m.role,
-            content=m.content[:500] if len(m.content) > 500 else m.content,
-            thought=m.thought[:200] if m.thought and len(m.thought) > 200 else m.thought,
-            created_at=m.created_at,
-            highlights=m.match_highlights,
-            relevance=round(m.relevance_score, 3),
-            has_images=m.has_images,
-            has_code=m.has_code,
-        )
-        for m in result.matches
-    ]
-
-    pagination = SearchPagination(
-        total=result.total_count,
-        page=result.page,
-        page_size=result.page_size,
-        total_pages=(result.total_count + result.page_size - 1) // result.page_size,
-    )
-
-    return SearchResponse(
-        matches=matches,
-        pagination=pagination,
-        query=result.query,
-    )
+    # Search results come from our own store, so serialize the plain dict
+    # form directly instead of validating each match model.
+    body = orjson.dumps(search_service.search_to_dict(result))
+    await search_cache.set(cache_key, body, generation)
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/semantic-search", response_model=SemanticSearchResponse)
@@ -564,10 +568,8 @@ async def semantic_search_messages(
             available=False,
         )
 
-    # We need to get the Redis client - use a workaround for now
-    # In production, this would be injected properly
-    redis_client = await session_manager._redis.health_check()  # Access internal client
-    if not redis_client:
+    # Liveness is cached for a few seconds, so this rarely costs a round-trip
+    if not await session_manager._redis.is_healthy():
         return SemanticSearchResponse(
             matches=[],
             query=request.query,
@@ -595,9 +597,10 @@ async def semantic_search_messages(
         filter_metadata=filter_metadata,
     )
 
-    # Convert to response format
+    # Convert to response format. Results come from our own vector store,
+    # so skip per-row validation.
     matches = [
-        SemanticSearchMatch(
+        SemanticSearchMatch.model_construct(
             message_id=r.id,
             session_id=r.metadata.get("session_id", "unknown"),
             similarity=round(r.score, 4),
@@ -3,23 +3,24 @@
 import asyncio
 import json
 import logging
-import uuid
+import secrets
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 
 from app.config import get_settings
 from app.dependencies import (
     get_history_service_ws,
-    get_llm_client,
+    get_llm_client_ws,
     get_session_manager_ws,
 )
 from app.models.domain.message import Message
-from app.services.functions.executor import FunctionExecutor
+from app.services.functions.executor import get_function_executor
 from app.services.functions.registry import get_function_registry
 from app.services.llm.client import VLLMClient
-from app.services.llm.message_builder import MessageBuilder
+from app.services.llm.message_builder import get_history_build_cache
 from app.services.llm.prompts import get_system_prompt
 from app.services.llm.qwen_client import QwenAgentClient
 from app.services.llm.token_utils import calculate_max_tokens
@@ -55,7 +56,7 @@ class WebSocketChatHandler:
         self.history_service = history_service
         self.llm_client = llm_client
         self.settings = get_settings()
-        self.function_executor = FunctionExecutor(registry=get_function_registry())
+        self.function_executor = get_function_executor()
 
         # Cancellation control
         self._cancelled = asyncio.Event()
@@ -67,10 +68,10 @@ class WebSocketChatHandler:
             return False
 
         try:
-            await self.websocket.send_json({
-                "type": event_type,
-                **data,
-            })
+            # orjson encodes straight to UTF-8; sent as a text frame for the browser client
+            await self.websocket.send_text(
+                orjson.dumps({"type": event_type, **data}).decode()
+            )
             return True
         except Exception as e:
             logger.warning(f"Failed to send WebSocket event: {e}")
@@ -126,28 +127,26 @@ class WebSocketChatHandler:
             })
             return
 
-        request_id = str(uuid.uuid4())
+        request_id = secrets.token_hex(16)
         self._cancelled.clear()
 
-        # Save user message
         user_message = Message(
             role="user",
             content=content,
             session_id=session_id,
         )
-        await self.history_service.append_message(
+        # Save user message and get the prior context in one round-trip
+        history_without_current = await self.history_service.append_and_get_context(
             session_id,
             user_message,
             self.settings.session_ttl_seconds,
         )
 
-        # Get history and build context
-        history = await self.history_service.get_context_messages(session_id)
-        history_without_current = history[:-1]
-
-        llm_messages = [{"role": "system", "content": get_system_prompt()}]
-        llm_messages.extend(MessageBuilder.build_messages(history_without_current))
-        llm_messages.append({"role": "user", "content": content})
+        llm_messages = [
+            {"role": "system", "content": get_system_prompt()},
+            *get_history_build_cache().build(session_id, history_without_current),
+            {"role": "user", "content": content},
+        ]
 
         # Calculate safe max_tokens based on prompt size
         max_tokens = calculate_max_tokens(llm_messages, requested_max_tokens=requested_max_tokens)
@@ -186,6 +185,8 @@ class WebSocketChatHandler:
         # Get tools from function registry (includes memory tools)
         registry = get_function_registry()
         tools = registry.get_openai_tools()
+        # Same tool spec on every iteration keeps the request prefix stable
+        tools_kwargs = {"tools": tools, "tool_choice": "auto" if tools else None}
 
         # Track overall state across tool iterations
         final_content_buffer = ""
@@ -202,8 +203,7 @@ class WebSocketChatHandler:
                     messages=llm_messages,
                     max_tokens=max_tokens,
                     temperature=temperature,
-                    tools=tools,
-                    tool_choice="auto" if tools else None,
+                    **tools_kwargs,
                 )
 
                 # Buffer for this iteration
@@ -396,12 +396,12 @@ class WebSocketChatHandler:
                 content=final_content_buffer,
                 session_id=session_id,
             )
-            await self.history_service.append_message(
+            await self.history_service.append_and_bump(
                 session_id,
-                assistant_message,
+                [assistant_message],
                 self.settings.session_ttl_seconds,
+                count_delta=2,
             )
-            await self.session_manager.increment_message_count(session_id, 2)
 
             # Send final stats
             elapsed = asyncio.get_event_loop().time() - start_time
@@ -435,7 +435,7 @@ async def websocket_chat(
     websocket: WebSocket,
     session_manager: SessionManager = Depends(get_session_manager_ws),
     history_service: ChatHistoryService = Depends(get_history_service_ws),
-    llm_client: VLLMClient | QwenAgentClient = Depends(get_llm_client),
+    llm_client: VLLMClient | QwenAgentClient = Depends(get_llm_client_ws),
 ):
     """
     WebSocket endpoint for bidirectional chat streaming.
@@ -468,7 +468,7 @@ async def websocket_chat(
     try:
         while True:
             try:
-                data = await websocket.receive_json()
+                data = orjson.loads(await websocket.receive_text())
                 await handler.handle_message(data)
             except json.JSONDecodeError:
                 await handler.send_event("error", {
@@ -28,6 +28,9 @@ class Settings(BaseSettings):
     vllm_max_model_len: int = 46000  # Must match vLLM server's --max-model-len
     vllm_timeout: float = 120.0
     vllm_temperature: float = 0.6  # Qwen3 recommended
+    vllm_max_connections: int = 256
+    vllm_max_keepalive_connections: int = 64
+    vllm_keepalive_expiry: float = 60.0  # Keep idle connections alive across request gaps
 
     # Qwen-Agent (enable for proper parallel tool calling)
     qwen_agent_enabled: bool = True
@@ -50,6 +53,7 @@ class Settings(BaseSettings):
     # Session
     session_ttl_seconds: int = 86400  # 24 hours
     max_history_messages: int = 50
+    history_trim_buffer: int = 10  # Trim history in blocks to keep the prompt prefix stable
 
     # Queue
     queue_stream_name: str = "llm_requests"
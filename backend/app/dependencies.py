@@ -4,20 +4,26 @@ from typing import Annotated
 
 from fastapi import Depends, Header, HTTPException, Request, WebSocket, status
 
-from app.config import get_settings
+from app.config import Settings, get_settings
 from app.redis.client import RedisClient
 from app.services.llm.client import VLLMClient
 from app.services.llm.qwen_client import QwenAgentClient
 from app.services.schema.registry import SchemaRegistry, get_schema_registry
-from app.services.schema.validator import SchemaValidator
+from app.services.schema.validator import SchemaValidator, get_schema_validator
 from app.services.session.history import ChatHistoryService
 from app.services.session.manager import SessionManager
+from app.services.session.search import SearchCache
 
 # ============================================================================
 # HTTP Request Dependencies
 # ============================================================================
 
 
+async def get_settings_dep() -> Settings:
+    """Get cached settings instance (async to avoid threadpool offload)."""
+    return get_settings()
+
+
 async def get_redis_client(request: Request) -> RedisClient:
     """Get Redis client from app state (HTTP endpoints)."""
     return request.app.state.redis
@@ -36,7 +42,18 @@ async def get_history_service(
 ) -> ChatHistoryService:
     """Get chat history service instance."""
     settings = get_settings()
-    return ChatHistoryService(redis, settings.max_history_messages)
+    return ChatHistoryService(
+        redis,
+        settings.max_history_messages,
+        settings.history_trim_buffer,
+    )
+
+
+async def get_search_cache(
+    redis: Annotated[RedisClient, Depends(get_redis_client)]
+) -> SearchCache:
+    """Get search response cache instance."""
+    return SearchCache(redis)
 
 
 # ============================================================================
@@ -62,11 +79,19 @@ async def get_history_service_ws(
 ) -> ChatHistoryService:
     """Get chat history service instance for WebSocket."""
     settings = get_settings()
-    return ChatHistoryService(redis, settings.max_history_messages)
+    return ChatHistoryService(
+        redis,
+        settings.max_history_messages,
+        settings.history_trim_buffer,
+    )
+
 
+def create_llm_client() -> VLLMClient | QwenAgentClient:
+    """Create the shared LLM client (QwenAgentClient if enabled, else VLLMClient).
 
-async def get_llm_client() -> VLLMClient | QwenAgentClient:
-    """Get LLM client instance (QwenAgentClient if enabled, else VLLMClient)."""
+    Called once from the application lifespan; the instance is stored on
+    app.state so its HTTP connection pool is reused across requests.
+    """
     settings = get_settings()
 
     if settings.qwen_agent_enabled:
@@ -86,6 +111,16 @@ async def get_llm_client() -> VLLMClient | QwenAgentClient:
     )
 
 
+async def get_llm_client(request: Request) -> VLLMClient | QwenAgentClient:
+    """Get shared LLM client from app state (HTTP endpoints)."""
+    return request.app.state.llm_client
+
+
+async def get_llm_client_ws(websocket: WebSocket) -> VLLMClient | QwenAgentClient:
+    """Get shared LLM client from app state (WebSocket endpoints)."""
+    return websocket.app.state.llm_client
+
+
 async def get_session_id(
     x_session_id: Annotated[str | None, Header()] = None
 ) -> str:
@@ -122,11 +157,11 @@ async def validate_session(
     return session_id
 
 
-def get_schema_registry_dep() -> SchemaRegistry:
+async def get_schema_registry_dep() -> SchemaRegistry:
     """Get schema registry instance."""
     return get_schema_registry()
 
 
-def get_schema_validator() -> SchemaValidator:
+async def get_schema_validator_dep() -> SchemaValidator:
     """Get schema validator instance."""
-    return SchemaValidator()
+    return get_schema_validator()
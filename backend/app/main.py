@@ -4,9 +4,11 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.router import api_router
 from app.config import get_settings
+from app.dependencies import create_llm_client
 from app.middleware.error_handler import setup_exception_handlers
 from app.middleware.observability import get_logger, setup_observability
 from app.middleware.request_id import RequestIDMiddleware
@@ -35,12 +37,18 @@ async def lifespan(app: FastAPI):
     app.state.postgres = postgres_client
     logger.info("PostgreSQL initialized")
 
+    # Initialize shared LLM client (one HTTP connection pool for all requests)
+    llm_client = create_llm_client()
+    app.state.llm_client = llm_client
+    logger.info("LLM client initialized")
+
     yield
 
     # Shutdown
     logger.info("Shutting down...")
     await redis_client.disconnect()
     await postgres_client.disconnect()
+    await llm_client.close()
     logger.info("Shutdown complete")
 
 
@@ -51,6 +59,7 @@ def create_app() -> FastAPI:
         version="1.0.0",
         description="Vision-Language Model Chat API for Qwen3-VL-30B-A3B",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
     )
@@ -1,6 +1,6 @@
 """Request ID middleware for tracing."""
 
-import uuid
+import secrets
 from collections.abc import Callable
 
 from fastapi import Request, Response
@@ -24,7 +24,7 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         # Get or generate request ID
         request_id = request.headers.get(self.HEADER_NAME)
         if not request_id:
-            request_id = str(uuid.uuid4())
+            request_id = secrets.token_hex(16)
 
         # Store in request state
         request.state.request_id = request_id
@@ -1,14 +1,15 @@
 """Domain models for messages."""
 
-import json
 import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class Message:
     """Chat message domain model."""
 
@@ -48,13 +49,14 @@ class Message:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict())
+        return orjson.dumps(self.to_dict()).decode()
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Message":
         """Create from dictionary."""
         return cls(
-            id=data.get("id", str(uuid.uuid4())),
+            # Stored messages always carry an id; only generate one for legacy entries
+            id=data["id"] if "id" in data else str(uuid.uuid4()),
             role=data["role"],
             content=data["content"],
             thought=data.get("thought"),
@@ -70,7 +72,7 @@ class Message:
     @classmethod
     def from_json(cls, json_str: str) -> "Message":
         """Create from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(orjson.loads(json_str))
 
     def to_api_format(self) -> dict[str, Any]:
         """Convert to API response format."""
@@ -1,12 +1,13 @@
 """Domain models for sessions."""
 
-import json
 import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+import orjson
+
 
 @dataclass
 class Session:
@@ -51,7 +52,7 @@ class Session:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict())
+        return orjson.dumps(self.to_dict()).decode()
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Session":
@@ -68,7 +69,7 @@ class Session:
     @classmethod
     def from_json(cls, json_str: str) -> "Session":
         """Create from JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(orjson.loads(json_str))
 
     def to_api_response(self) -> dict[str, Any]:
         """Convert to API response format."""
@@ -1,7 +1,7 @@
 """Pydantic schemas for chat API."""
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -33,6 +33,13 @@ class OutputSchema(BaseModel):
     )
 
 
+class PriorMessage(BaseModel):
+    """Caller-supplied conversation turn for stateless requests."""
+
+    role: Literal["user", "assistant"]
+    content: str
+
+
 class ChatRequest(BaseModel):
     """Chat message request."""
 
@@ -43,6 +50,14 @@ class ChatRequest(BaseModel):
         None,
         description="Enable structured JSON output with schema validation",
     )
+    stateless: bool = Field(
+        False,
+        description="If true, history is neither read nor written; use prior_messages for context",
+    )
+    prior_messages: list[PriorMessage] = Field(
+        default_factory=list,
+        description="Conversation context for stateless requests (ignored otherwise)",
+    )
 
     @field_validator("output_schema")
     @classmethod
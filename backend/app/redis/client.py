@@ -2,17 +2,22 @@
 
 import asyncio
 import logging
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Any, Optional
 
 import redis.asyncio as redis
 from redis.asyncio import ConnectionPool, Redis
+from redis.asyncio.client import Pipeline
 
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# How long a successful ping is trusted by is_healthy()
+HEALTH_CACHE_SECONDS = 5.0
+
 
 class RedisClient:
     """
@@ -33,6 +38,7 @@ class RedisClient:
         self._client: Redis | None = None
         self._initialized = False
         self._settings = get_settings()
+        self._healthy_until = 0.0
 
     @classmethod
     async def get_instance(cls) -> "RedisClient":
@@ -93,15 +99,41 @@ class RedisClient:
         except Exception:
             raise
 
+    async def transaction(
+        self,
+        func: Callable[[Pipeline], Awaitable[Any]],
+        *watches: str,
+        value_from_callable: bool = False,
+    ) -> Any:
+        """Run func(pipe) as an optimistic WATCH/MULTI transaction.
+
+        func reads watched keys, calls pipe.multi() and queues writes; it is
+        retried if a watched key changes before EXEC.
+        """
+        return await self.client.transaction(
+            func, *watches, value_from_callable=value_from_callable
+        )
+
     async def health_check(self) -> bool:
         """Check if Redis is healthy."""
         try:
             await self.client.ping()
+            self._healthy_until = time.monotonic() + HEALTH_CACHE_SECONDS
             return True
         except Exception as e:
+            self._healthy_until = 0.0
             logger.error(f"Redis health check failed: {e}")
             return False
 
+    async def is_healthy(self) -> bool:
+        """Cheap liveness check for hot paths.
+
+        Trusts a successful ping for HEALTH_CACHE_SECONDS before probing again.
+        """
+        if time.monotonic() < self._healthy_until:
+            return True
+        return await self.health_check()
+
 
 # Global instance accessor
 async def get_redis() -> RedisClient:
@@ -16,6 +16,26 @@ class RedisKeys:
         """Chat history for a session."""
         return f"{cls.PREFIX}:history:{session_id}"
 
+    @classmethod
+    def recent_sessions(cls) -> str:
+        """Sorted set of session IDs scored by updated_at (recency index)."""
+        return f"{cls.PREFIX}:sessions:recent"
+
+    @classmethod
+    def recent_sessions_backfilled(cls) -> str:
+        """Marker set once the recency index has been backfilled from a SCAN."""
+        return f"{cls.PREFIX}:sessions:recent:backfilled"
+
+    @classmethod
+    def search_cache(cls, digest: str) -> str:
+        """Cached search response keyed by request hash."""
+        return f"{cls.PREFIX}:search:{digest}"
+
+    @classmethod
+    def search_generation(cls) -> str:
+        """Counter bumped when history is deleted or rewritten (invalidates search cache)."""
+        return f"{cls.PREFIX}:search:generation"
+
     @classmethod
     def rate_limit(cls, identifier: str) -> str:
         """Rate limiting key for user/session."""
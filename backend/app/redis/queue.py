@@ -3,6 +3,7 @@
 import asyncio
 import json
 import logging
+import secrets
 import time
 import uuid
 from collections.abc import Callable
@@ -79,7 +80,7 @@ class QueueProducer:
         Returns:
             request_id: Unique request identifier
         """
-        request_id = str(uuid.uuid4())
+        request_id = secrets.token_hex(16)
 
         request = QueuedRequest(
             request_id=request_id,
@@ -5,6 +5,7 @@ Supports lazy loading and caching for efficiency.
 """
 
 import logging
+import threading
 from typing import Any
 
 import numpy as np
@@ -16,6 +17,8 @@ logger = logging.getLogger(__name__)
 # Lazy-loaded model
 _model: Any = None
 _model_name: str | None = None
+# Guards the lazy load; embed_batch runs in worker threads via asyncio.to_thread
+_model_lock = threading.Lock()
 
 
 def _load_model(model_name: str) -> Any:
@@ -28,31 +31,36 @@ def _load_model(model_name: str) -> Any:
     if _model is not None and _model_name == model_name:
         return _model
 
-    try:
-        import os
+    with _model_lock:
+        # Another thread may have loaded it while we waited
+        if _model is not None and _model_name == model_name:
+            return _model
 
-        import torch
-        from sentence_transformers import SentenceTransformer
-
-        # Force CPU and use all available logical cores
-        num_threads = os.cpu_count() or 8
-        torch.set_num_threads(num_threads)
-
-        logger.info(f"Loading embedding model on CPU ({num_threads} threads): {model_name}")
-        _model = SentenceTransformer(model_name, device="cpu")
-        _model_name = model_name
-        logger.info(f"Embedding model loaded on CPU with {num_threads} threads")
-        return _model
-    except ImportError:
-        logger.warning(
-            "sentence-transformers not installed. "
-            "Vector search will be disabled. "
-            "Install with: pip install sentence-transformers"
-        )
-        return None
-    except Exception as e:
-        logger.error(f"Failed to load embedding model: {e}")
-        return None
+        try:
+            import os
+
+            import torch
+            from sentence_transformers import SentenceTransformer
+
+            # Force CPU and use all available logical cores
+            num_threads = os.cpu_count() or 8
+            torch.set_num_threads(num_threads)
+
+            logger.info(f"Loading embedding model on CPU ({num_threads} threads): {model_name}")
+            _model = SentenceTransformer(model_name, device="cpu")
+            _model_name = model_name
+            logger.info(f"Embedding model loaded on CPU with {num_threads} threads")
+            return _model
+        except ImportError:
+            logger.warning(
+                "sentence-transformers not installed. "
+                "Vector search will be disabled. "
+                "Install with: pip install sentence-transformers"
+            )
+            return None
+        except Exception as e:
+            logger.error(f"Failed to load embedding model: {e}")
+            return None
 
 
 class EmbeddingService:
@@ -137,7 +145,8 @@ class EmbeddingService:
                 normalize_embeddings=True,
                 show_progress_bar=False,
             )
-            return [e.astype(np.float32) for e in embeddings]
+            # Cast the whole (n, dim) matrix once rather than row by row
+            return list(embeddings.astype(np.float32, copy=False))
         except Exception as e:
             logger.error(f"Failed to generate batch embeddings: {e}")
             return None
@@ -4,6 +4,8 @@ Stores embeddings with metadata in Redis and provides
 efficient similarity search using cosine similarity.
 """
 
+import asyncio
+import base64
 import json
 import logging
 from dataclasses import dataclass
@@ -23,6 +25,19 @@ VECTOR_DATA_PREFIX = "vec:data:"
 VECTOR_INDEX_PREFIX = "vec:idx:"
 
 
+def _encode_embedding(embedding: np.ndarray) -> str:
+    """Pack an embedding as base64 FP16 bytes (2 bytes/dim instead of a JSON float list)."""
+    return base64.b64encode(embedding.astype(np.float16).tobytes()).decode("ascii")
+
+
+def _decode_embedding(data: dict[str, Any]) -> np.ndarray:
+    """Unpack a stored embedding to float32, accepting legacy JSON float lists."""
+    packed = data.get("embedding_f16")
+    if packed is not None:
+        return np.frombuffer(base64.b64decode(packed), dtype=np.float16).astype(np.float32)
+    return np.array(data["embedding"], dtype=np.float32)
+
+
 @dataclass
 class VectorSearchResult:
     """Result from vector similarity search."""
@@ -36,7 +51,7 @@ class VectorStore:
     """
     Redis-based vector store for embeddings.
 
-    Stores embeddings as JSON-serialized numpy arrays with associated metadata.
+    Stores embeddings as base64-encoded FP16 vectors with associated metadata.
     Provides similarity search using in-memory cosine similarity computation.
 
     For production with large datasets, consider using:
@@ -95,7 +110,7 @@ class VectorStore:
             data = {
                 "id": id,
                 "text": text[:500],  # Store truncated text for reference
-                "embedding": embedding.tolist(),  # Convert to list for JSON
+                "embedding_f16": _encode_embedding(embedding),
                 "metadata": metadata or {},
             }
 
@@ -147,7 +162,9 @@ class VectorStore:
             texts = [item[1] for item in items]
             metadatas = [item[2] or {} for item in items]
 
-            embeddings = self._embeddings.embed_batch(texts)
+            # One batched encode for all texts, run off the event loop so the
+            # forward pass doesn't stall other requests
+            embeddings = await asyncio.to_thread(self._embeddings.embed_batch, texts)
             if embeddings is None:
                 return 0
 
@@ -155,24 +172,27 @@ class VectorStore:
             import time
             timestamp = time.time()
             added = 0
+            index_entries: dict[str, float] = {}
 
             async with self._redis.pipeline() as pipe:
                 for i, (id, text, metadata) in enumerate(zip(ids, texts, metadatas)):
                     data = {
                         "id": id,
                         "text": text[:500],
-                        "embedding": embeddings[i].tolist(),
+                        "embedding_f16": _encode_embedding(embeddings[i]),
                         "metadata": metadata,
                     }
                     key = self._vector_key(id)
                     pipe.set(key, json.dumps(data))
                     if ttl_seconds:
                         pipe.expire(key, ttl_seconds)
-                    pipe.zadd(self._index_key(), {id: timestamp + i * 0.001})
+                    index_entries[id] = timestamp + i * 0.001
                     added += 1
 
-            if ttl_seconds:
-                await self._redis.client.expire(self._index_key(), ttl_seconds)
+                # Single ZADD for the whole batch
+                pipe.zadd(self._index_key(), index_entries)
+                if ttl_seconds:
+                    pipe.expire(self._index_key(), ttl_seconds)
 
             logger.info(f"Added {added} vectors in batch")
             return added
@@ -239,7 +259,7 @@ class VectorStore:
                 return []
 
             # Extract embeddings and compute similarities
-            embeddings = [np.array(v["embedding"], dtype=np.float32) for v in vectors]
+            embeddings = [_decode_embedding(v) for v in vectors]
             similarities = self._embeddings.cosine_similarity(query_embedding, embeddings)
 
             # Create results with scores
@@ -1,6 +1,11 @@
 """Function calling services for tool use."""
 
-from app.services.functions.executor import FunctionExecutor
+from app.services.functions.executor import FunctionExecutor, get_function_executor
 from app.services.functions.registry import FunctionRegistry, get_function_registry
 
-__all__ = ["FunctionExecutor", "FunctionRegistry", "get_function_registry"]
+__all__ = [
+    "FunctionExecutor",
+    "FunctionRegistry",
+    "get_function_executor",
+    "get_function_registry",
+]
@@ -11,7 +11,9 @@ import hashlib
 import json
 import logging
 import time
+from collections import defaultdict, deque
 from dataclasses import dataclass
+from itertools import islice
 from typing import Any
 
 from app.services.functions.registry import FunctionRegistry, get_function_registry
@@ -68,8 +70,12 @@ class FunctionExecutor:
         self._cache_ttl = cache_ttl_seconds
         self._max_cache_size = max_cache_size
         self._cache: dict[str, tuple[Any, float]] = {}
-        self._audit_log: list[ExecutionAudit] = []
         self._max_audit_entries = 1000
+        # Bounded ring buffers: overall and per function name
+        self._audit_log: deque[ExecutionAudit] = deque(maxlen=self._max_audit_entries)
+        self._audit_by_name: defaultdict[str, deque[ExecutionAudit]] = defaultdict(
+            lambda: deque(maxlen=self._max_audit_entries)
+        )
 
     def _cache_key(self, name: str, arguments: dict[str, Any]) -> str:
         """Generate cache key for function call."""
@@ -131,11 +137,9 @@ class FunctionExecutor:
             result_hash=result_hash,
         )
 
+        # Oldest entries drop off automatically
         self._audit_log.append(audit)
-
-        # Trim old entries
-        if len(self._audit_log) > self._max_audit_entries:
-            self._audit_log = self._audit_log[-self._max_audit_entries:]
+        self._audit_by_name[name].append(audit)
 
     async def execute(
         self,
@@ -255,12 +259,14 @@ class FunctionExecutor:
         Returns:
             List of audit entries (most recent first)
         """
-        entries = self._audit_log
-
         if function_name:
-            entries = [e for e in entries if e.function_name == function_name]
+            entries = self._audit_by_name.get(function_name)
+            if not entries:
+                return []
+        else:
+            entries = self._audit_log
 
-        return list(reversed(entries[-limit:]))
+        return list(islice(reversed(entries), max(limit, 0)))
 
     def clear_cache(self) -> int:
         """Clear the result cache. Returns number of entries cleared."""
@@ -300,3 +306,15 @@ class FunctionExecutor:
             "cache_enabled": self._enable_cache,
             "registered_functions": len(self._registry.list_functions()),
         }
+
+
+# Global executor singleton
+_executor: FunctionExecutor | None = None
+
+
+def get_function_executor() -> FunctionExecutor:
+    """Get the global function executor."""
+    global _executor
+    if _executor is None:
+        _executor = FunctionExecutor()
+    return _executor
@@ -7,6 +7,7 @@ including parameter validation and OpenAI-compatible tool definitions.
 import logging
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,21 @@ class FunctionDefinition:
     cacheable: bool = True
     category: str = "general"
 
+    @cached_property
+    def parameter_info(self) -> list[dict[str, Any]]:
+        """Parameters as plain dicts for API responses, built once."""
+        return [
+            {
+                "name": p.name,
+                "type": p.type,
+                "description": p.description,
+                "required": p.required,
+                "default": p.default,
+                "enum": p.enum,
+            }
+            for p in self.parameters
+        ]
+
 
 class FunctionRegistry:
     """
@@ -51,8 +67,19 @@ class FunctionRegistry:
 
     def __init__(self):
         self._functions: dict[str, FunctionDefinition] = {}
+        # OpenAI tool definitions by name and as an unfiltered list, rebuilt
+        # only when functions change
+        self._tool_defs: dict[str, dict[str, Any]] | None = None
+        self._tools_cache: list[dict[str, Any]] | None = None
+        # Bumped on every change so callers can invalidate derived caches
+        self._version = 0
         self._load_builtins()
 
+    @property
+    def version(self) -> int:
+        """Counter incremented whenever functions are registered or removed."""
+        return self._version
+
     def _load_builtins(self):
         """Load built-in functions including memory tools."""
         from app.services.functions.builtins import get_all_builtin_functions
@@ -68,6 +95,9 @@ class FunctionRegistry:
             func_def: Function definition with name, params, and handler
         """
         self._functions[func_def.name] = func_def
+        self._tool_defs = None
+        self._tools_cache = None
+        self._version += 1
         logger.debug(f"Registered function: {func_def.name}")
 
     def unregister(self, name: str) -> bool:
@@ -82,6 +112,9 @@ class FunctionRegistry:
         """
         if name in self._functions:
             del self._functions[name]
+            self._tool_defs = None
+            self._tools_cache = None
+            self._version += 1
             return True
         return False
 
@@ -106,6 +139,52 @@ class FunctionRegistry:
             ]
         return list(self._functions.keys())
 
+    def list_function_defs(self, category: str | None = None) -> list[FunctionDefinition]:
+        """
+        List registered function definitions.
+
+        Args:
+            category: Optional category filter
+
+        Returns:
+            List of function definitions
+        """
+        if category:
+            return [func for func in self._functions.values() if func.category == category]
+        return list(self._functions.values())
+
+    @staticmethod
+    def _build_tool(func: FunctionDefinition) -> dict[str, Any]:
+        """Build the OpenAI tool definition for a single function."""
+        # Build parameter schema
+        properties = {}
+        required = []
+
+        for param in func.parameters:
+            prop: dict[str, Any] = {
+                "type": param.type,
+                "description": param.description,
+            }
+            if param.enum:
+                prop["enum"] = param.enum
+            properties[param.name] = prop
+
+            if param.required:
+                required.append(param.name)
+
+        return {
+            "type": "function",
+            "function": {
+                "name": func.name,
+                "description": func.description,
+                "parameters": {
+                    "type": "object",
+                    "properties": properties,
+                    "required": required,
+                },
+            },
+        }
+
     def get_openai_tools(
         self,
         include: list[str] | None = None,
@@ -119,49 +198,25 @@ class FunctionRegistry:
             exclude: Exclude these functions
 
         Returns:
-            List of tool definitions in OpenAI format
+            List of tool definitions in OpenAI format. Definitions are cached
+            and shared between callers, so they must not be mutated.
         """
-        tools = []
-        exclude_set = set(exclude or [])
-
-        for name, func in self._functions.items():
-            # Apply filters
-            if include and name not in include:
-                continue
-            if name in exclude_set:
-                continue
-
-            # Build parameter schema
-            properties = {}
-            required = []
-
-            for param in func.parameters:
-                prop: dict[str, Any] = {
-                    "type": param.type,
-                    "description": param.description,
-                }
-                if param.enum:
-                    prop["enum"] = param.enum
-                properties[param.name] = prop
-
-                if param.required:
-                    required.append(param.name)
-
-            tool = {
-                "type": "function",
-                "function": {
-                    "name": func.name,
-                    "description": func.description,
-                    "parameters": {
-                        "type": "object",
-                        "properties": properties,
-                        "required": required,
-                    },
-                },
+        if self._tool_defs is None:
+            self._tool_defs = {
+                name: self._build_tool(func) for name, func in self._functions.items()
             }
-            tools.append(tool)
+            self._tools_cache = list(self._tool_defs.values())
 
-        return tools
+        if not include and not exclude:
+            return self._tools_cache
+
+        # Apply filters over the cached definitions
+        include_set = set(include) if include else None
+        exclude_set = set(exclude or [])
+        return [
+            tool for name, tool in self._tool_defs.items()
+            if (include_set is None or name in include_set) and name not in exclude_set
+        ]
 
     def validate_call(
         self,
@@ -6,6 +6,7 @@ from collections.abc import AsyncGenerator
 from typing import Any
 
 import httpx
+import orjson
 from openai import AsyncOpenAI
 
 from app.config import get_settings
@@ -35,17 +36,29 @@ class VLLMClient:
         self._model = model or settings.vllm_model
         self._timeout = timeout or settings.vllm_timeout
 
+        # Pooled keep-alive connections, shared for the lifetime of the client
+        limits = httpx.Limits(
+            max_connections=settings.vllm_max_connections,
+            max_keepalive_connections=settings.vllm_max_keepalive_connections,
+            keepalive_expiry=settings.vllm_keepalive_expiry,
+        )
+
         # OpenAI client for non-streaming and health checks
         self._client = AsyncOpenAI(
             base_url=self._base_url,
             api_key=self._api_key,
             timeout=self._timeout,
+            http_client=httpx.AsyncClient(
+                timeout=httpx.Timeout(self._timeout, connect=10.0),
+                limits=limits,
+            ),
         )
 
         # httpx client for streaming (to access reasoning_content)
         self._http_client = httpx.AsyncClient(
             base_url=self._base_url,
             timeout=httpx.Timeout(self._timeout, connect=10.0),
+            limits=limits,
             headers={
                 "Authorization": f"Bearer {self._api_key}",
                 "Content-Type": "application/json",
@@ -86,7 +99,7 @@ class VLLMClient:
             async with self._http_client.stream(
                 "POST",
                 "/chat/completions",
-                json=payload,
+                content=orjson.dumps(payload),
             ) as response:
                 response.raise_for_status()
 
@@ -153,6 +166,7 @@ class VLLMClient:
         messages: list[dict[str, Any]],
         max_tokens: int = 4096,
         temperature: float = 0.6,
+        cache_salt: str | None = None,
     ) -> dict[str, Any]:
         """
         Non-streaming chat completion.
@@ -161,6 +175,8 @@ class VLLMClient:
             messages: Chat messages in OpenAI format
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
+            cache_salt: Optional vLLM prefix-cache salt (e.g. session ID) so
+                cached KV blocks are scoped to a single conversation
 
         Returns:
             Dict with content and usage info
@@ -171,6 +187,7 @@ class VLLMClient:
                 messages=messages,
                 max_completion_tokens=max_tokens,
                 temperature=temperature,
+                extra_body={"cache_salt": cache_salt} if cache_salt else None,
             )
 
             choice = response.choices[0]
@@ -203,5 +220,12 @@ class VLLMClient:
             return False
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP clients."""
         await self._http_client.aclose()
+        await self._client.close()
+
+    async def __aenter__(self) -> "VLLMClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
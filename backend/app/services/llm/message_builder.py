@@ -1,10 +1,59 @@
 """Build vLLM-compatible message format."""
 
+from collections import OrderedDict
 from typing import Any
 
 from app.models.domain.message import Message
 
 
+class HistoryBuildCache:
+    """
+    Per-session cache of built history message dicts.
+
+    History is append-mostly, so the dicts built for earlier turns can be
+    reused and only the new suffix built. The cached prefix is validated by
+    message ID (first and last) so trimming, truncation or clearing of the
+    history falls back to a full rebuild.
+    """
+
+    def __init__(self, max_sessions: int = 256):
+        self._max_sessions = max_sessions
+        # session_id -> (first_id, last_id, built dicts)
+        self._entries: OrderedDict[str, tuple[str, str, list[dict[str, Any]]]] = OrderedDict()
+
+    def build(self, session_id: str, messages: list[Message]) -> list[dict[str, Any]]:
+        """
+        Build (or extend) the message dicts for a session's history.
+
+        The returned list is shared with the cache and must not be mutated.
+        """
+        if not messages:
+            return []
+
+        built: list[dict[str, Any]] | None = None
+        entry = self._entries.get(session_id)
+        if entry is not None:
+            first_id, last_id, cached = entry
+            cached_len = len(cached)
+            if (
+                cached_len <= len(messages)
+                and messages[0].id == first_id
+                and messages[cached_len - 1].id == last_id
+            ):
+                built = cached
+                built.extend(MessageBuilder.build_messages(messages[cached_len:]))
+
+        if built is None:
+            built = MessageBuilder.build_messages(messages)
+
+        self._entries[session_id] = (messages[0].id, messages[-1].id, built)
+        self._entries.move_to_end(session_id)
+        if len(self._entries) > self._max_sessions:
+            self._entries.popitem(last=False)
+
+        return built
+
+
 class MessageBuilder:
     """
     Builds vLLM-compatible message format.
@@ -24,15 +73,7 @@ class MessageBuilder:
         Returns:
             List of dicts in OpenAI chat format
         """
-        result = []
-
-        for msg in messages:
-            result.append({
-                "role": msg.role,
-                "content": msg.content,
-            })
-
-        return result
+        return [{"role": msg.role, "content": msg.content} for msg in messages]
 
     @staticmethod
     def build_single_message(
@@ -85,3 +126,12 @@ class MessageBuilder:
         messages.extend(MessageBuilder.build_messages(history))
 
         return messages
+
+
+# Global singleton instance (shared by all requests in this process)
+_history_cache = HistoryBuildCache()
+
+
+def get_history_build_cache() -> HistoryBuildCache:
+    """Get the global history build cache."""
+    return _history_cache
@@ -5,6 +5,7 @@ Enables dynamic model selection based on requirements and availability.
 """
 
 import logging
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -285,11 +286,13 @@ class ModelRegistry:
     def get_stats(self) -> dict[str, Any]:
         """Get registry statistics."""
         models = list(self._models.values())
+        # Count all statuses in one pass
+        status_counts = Counter(m.status for m in models)
         return {
             "total_models": len(models),
-            "available": sum(1 for m in models if m.status == ModelStatus.AVAILABLE),
-            "degraded": sum(1 for m in models if m.status == ModelStatus.DEGRADED),
-            "unavailable": sum(1 for m in models if m.status == ModelStatus.UNAVAILABLE),
+            "available": status_counts[ModelStatus.AVAILABLE],
+            "degraded": status_counts[ModelStatus.DEGRADED],
+            "unavailable": status_counts[ModelStatus.UNAVAILABLE],
             "models": [m.to_dict() for m in models],
         }
 
@@ -55,18 +55,22 @@ ERROR_HANDLING = """## ERROR RESPONSES:
 # INTEGRATED PROMPTS
 # =============================================================================
 
+# Assembled once at import so every request sends the identical string
+BASE_SYSTEM_PROMPT = f"{IDENTITY}\n\n{RESPONSE_STANDARDS}\n\n{ERROR_HANDLING}"
+
+SYSTEM_PROMPT_WITH_MEMORY = f"{IDENTITY}\n\n{TOOL_CALLING}\n\n{RESPONSE_STANDARDS}\n\n{MEMORY_PROTOCOL}\n\n{ERROR_HANDLING}"
+
+
 def get_base_system_prompt():
-    return f"{IDENTITY}\n\n{RESPONSE_STANDARDS}\n\n{ERROR_HANDLING}"
+    return BASE_SYSTEM_PROMPT
 
 
 def get_system_prompt_with_memory():
-    return f"{IDENTITY}\n\n{TOOL_CALLING}\n\n{RESPONSE_STANDARDS}\n\n{MEMORY_PROTOCOL}\n\n{ERROR_HANDLING}"
+    return SYSTEM_PROMPT_WITH_MEMORY
 
 
 def get_system_prompt(has_memory_tools=True):
-    if has_memory_tools:
-        return get_system_prompt_with_memory()
-    return get_base_system_prompt()
+    return SYSTEM_PROMPT_WITH_MEMORY if has_memory_tools else BASE_SYSTEM_PROMPT
 
 
 # =============================================================================
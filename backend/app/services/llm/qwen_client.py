@@ -87,6 +87,9 @@ class QwenAgentClient:
         self._max_context = max_context or settings.vllm_max_model_len
         self._timeout = timeout or settings.vllm_timeout
         self._default_max_tokens = settings.vllm_max_tokens
+        self._extra_body: dict[str, Any] = {
+            "chat_template_kwargs": {"enable_thinking": True}
+        }
 
         # Initialize Qwen-Agent LLM with OpenAI-compatible config
         # NOTE: fncall_prompt_type='nous' (Hermes-style) is the DEFAULT and RECOMMENDED
@@ -104,9 +107,7 @@ class QwenAgentClient:
                 "top_k": 20,
                 "max_tokens": self._default_max_tokens,
                 # Enable thinking mode for reasoning visibility
-                "extra_body": {
-                    "chat_template_kwargs": {"enable_thinking": True}
-                },
+                "extra_body": self._extra_body,
             },
         })
 
@@ -421,6 +422,7 @@ class QwenAgentClient:
         messages: list[dict[str, Any]],
         max_tokens: int = 4096,
         temperature: float = 0.6,
+        cache_salt: str | None = None,
     ) -> dict[str, Any]:
         """
         Non-streaming chat completion.
@@ -429,20 +431,25 @@ class QwenAgentClient:
             messages: Chat messages in OpenAI format
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
+            cache_salt: Optional vLLM prefix-cache salt (e.g. session ID)
 
         Returns:
             Dict with content and usage info
         """
+        generate_cfg: dict[str, Any] = {
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if cache_salt:
+            # extra_generate_cfg replaces extra_body wholesale, so carry the defaults
+            generate_cfg["extra_body"] = {**self._extra_body, "cache_salt": cache_salt}
 
         def run_sync():
             responses = self._llm.chat(
                 messages=messages,
                 functions=None,
                 stream=False,
-                extra_generate_cfg={
-                    "max_tokens": max_tokens,
-                    "temperature": temperature,
-                },
+                extra_generate_cfg=generate_cfg,
             )
             return responses
 
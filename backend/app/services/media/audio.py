@@ -7,7 +7,6 @@ Supports:
 - Audio segmentation for long files
 """
 
-import base64
 import logging
 import subprocess
 from dataclasses import dataclass
@@ -15,6 +14,11 @@ from io import BytesIO
 from tempfile import NamedTemporaryFile
 from typing import Any
 
+try:
+    import pybase64 as base64  # SIMD-accelerated, drop-in for the stdlib module
+except ImportError:
+    import base64
+
 logger = logging.getLogger(__name__)
 
 
@@ -242,7 +246,7 @@ class AudioProcessor:
 
     def to_base64(self, audio_bytes: bytes) -> str:
         """Convert audio bytes to base64 string."""
-        return base64.b64encode(audio_bytes).decode("utf-8")
+        return base64.b64encode(audio_bytes).decode("ascii")
 
     def from_base64(self, base64_data: str) -> bytes:
         """Decode base64 audio data."""
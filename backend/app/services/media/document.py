@@ -7,12 +7,16 @@ Supports:
 - Basic OCR for scanned PDFs (optional)
 """
 
-import base64
 import logging
 from dataclasses import dataclass
 from io import BytesIO
 from typing import Any
 
+try:
+    import pybase64 as base64  # SIMD-accelerated, drop-in for the stdlib module
+except ImportError:
+    import base64
+
 logger = logging.getLogger(__name__)
 
 
@@ -312,7 +316,7 @@ class DocumentProcessor:
 
     def to_base64(self, doc_bytes: bytes) -> str:
         """Convert document bytes to base64 string."""
-        return base64.b64encode(doc_bytes).decode("utf-8")
+        return base64.b64encode(doc_bytes).decode("ascii")
 
     def from_base64(self, base64_data: str) -> bytes:
         """Decode base64 document data."""
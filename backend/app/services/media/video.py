@@ -7,7 +7,6 @@ Supports:
 - Duration and metadata extraction
 """
 
-import base64
 import logging
 import subprocess
 from dataclasses import dataclass
@@ -17,6 +16,11 @@ from typing import Any
 
 from PIL import Image
 
+try:
+    import pybase64 as base64  # SIMD-accelerated, drop-in for the stdlib module
+except ImportError:
+    import base64
+
 logger = logging.getLogger(__name__)
 
 
@@ -326,7 +330,7 @@ class VideoProcessor:
 
     def to_base64(self, video_bytes: bytes) -> str:
         """Convert video bytes to base64 string."""
-        return base64.b64encode(video_bytes).decode("utf-8")
+        return base64.b64encode(video_bytes).decode("ascii")
 
     def from_base64(self, base64_data: str) -> bytes:
         """Decode base64 video data."""
@@ -1,6 +1,6 @@
 """Schema services for structured output validation."""
 
-from app.services.schema.registry import SchemaRegistry
-from app.services.schema.validator import SchemaValidator
+from app.services.schema.registry import SchemaRegistry, get_schema_registry
+from app.services.schema.validator import SchemaValidator, get_schema_validator
 
-__all__ = ["SchemaRegistry", "SchemaValidator"]
+__all__ = ["SchemaRegistry", "SchemaValidator", "get_schema_registry", "get_schema_validator"]
@@ -188,6 +188,18 @@ class SchemaValidator:
         return SCHEMA_INSTRUCTION_TEMPLATE.format(schema=schema_str)
 
 
+# Global singleton instance (validator holds no per-request state)
+_validator: SchemaValidator | None = None
+
+
+def get_schema_validator() -> SchemaValidator:
+    """Get the global schema validator instance."""
+    global _validator
+    if _validator is None:
+        _validator = SchemaValidator()
+    return _validator
+
+
 # Convenience function for single-shot validation
 def validate_json_response(
     response: str,
@@ -203,5 +215,4 @@ def validate_json_response(
     Returns:
         Tuple of (parsed_data, errors)
     """
-    validator = SchemaValidator()
-    return validator.validate(response, schema)
+    return get_schema_validator().validate(response, schema)
@@ -3,8 +3,10 @@
 import logging
 
 from app.models.domain.message import Message
+from app.models.domain.session import Session
 from app.redis.client import RedisClient
 from app.redis.keys import RedisKeys
+from app.services.session.manager import queue_session_write
 
 logger = logging.getLogger(__name__)
 
@@ -19,9 +21,56 @@ class ChatHistoryService:
     - Clear history
     """
 
-    def __init__(self, redis: RedisClient, max_messages: int):
+    # Lua script for atomic truncate: find message by id, trim it and everything
+    # after it, refresh TTL and bump the search-cache generation.
+    # Returns the message index, or -1 if not found.
+    TRUNCATE_SCRIPT = """
+    local key = KEYS[1]
+    local generation_key = KEYS[2]
+    local message_id = ARGV[1]
+    local ttl = tonumber(ARGV[2])
+
+    local items = redis.call('LRANGE', key, 0, -1)
+    for i, item in ipairs(items) do
+        -- Only decode entries that contain the id
+        if string.find(item, message_id, 1, true) then
+            local ok, msg = pcall(cjson.decode, item)
+            if ok and msg['id'] == message_id then
+                local index = i - 1
+                if index == 0 then
+                    -- Removing first message means clear all
+                    redis.call('DEL', key)
+                else
+                    redis.call('LTRIM', key, 0, index - 1)
+                    redis.call('EXPIRE', key, ttl)
+                end
+                redis.call('INCR', generation_key)
+                return index
+            end
+        end
+    end
+    return -1
+    """
+
+    def __init__(self, redis: RedisClient, max_messages: int, trim_buffer: int = 0):
         self._redis = redis
+        self._truncate_script = None
         self._max_messages = max_messages
+        # Once history exceeds max_messages, drop this many extra messages in one
+        # go so the context prefix stays identical for several turns instead of
+        # sliding on every append (keeps vLLM prefix-cache hits).
+        self._trim_buffer = min(max(trim_buffer, 0), max_messages - 1)
+
+    def _get_truncate_script(self):
+        """Get or register the truncate Lua script."""
+        if self._truncate_script is None:
+            self._truncate_script = self._redis.client.register_script(self.TRUNCATE_SCRIPT)
+        return self._truncate_script
+
+    async def _trim_if_needed(self, key: str, length: int) -> None:
+        """Trim history in blocks once it grows past max_messages."""
+        if length > self._max_messages:
+            await self._redis.client.ltrim(key, -(self._max_messages - self._trim_buffer), -1)
 
     async def append_message(
         self,
@@ -40,16 +89,98 @@ class ChatHistoryService:
         message.session_id = session_id
         key = RedisKeys.session_history(session_id)
 
-        async with self._redis.pipeline() as pipe:
-            # Append to list
-            await pipe.rpush(key, message.to_json())
-            # Trim to max messages (keep last N)
-            await pipe.ltrim(key, -self._max_messages, -1)
-            # Refresh TTL
-            await pipe.expire(key, ttl_seconds)
+        pipe = self._redis.client.pipeline(transaction=True)
+        # Append to list
+        pipe.rpush(key, message.to_json())
+        # Refresh TTL
+        pipe.expire(key, ttl_seconds)
+        length, _ = await pipe.execute()
+
+        # Trim to max messages (in blocks of trim_buffer)
+        await self._trim_if_needed(key, length)
 
         logger.debug(f"Appended message to session {session_id}")
 
+    async def append_and_bump(
+        self,
+        session_id: str,
+        messages: list[Message],
+        ttl_seconds: int,
+        count_delta: int | None = None,
+    ) -> None:
+        """
+        Append messages and bump the session message count atomically.
+
+        The session is read under WATCH, then the history push/expire and the
+        updated session write are committed together in one MULTI/EXEC, so a
+        concurrent session update is retried rather than overwritten.
+
+        Args:
+            session_id: Session identifier
+            messages: Messages to append (in order)
+            ttl_seconds: TTL for the history and session keys
+            count_delta: Amount to add to message_count (defaults to len(messages))
+        """
+        history_key = RedisKeys.session_history(session_id)
+        session_key = RedisKeys.session(session_id)
+
+        for message in messages:
+            message.session_id = session_id
+        payloads = [message.to_json() for message in messages]
+        delta = len(messages) if count_delta is None else count_delta
+
+        async def append(pipe) -> None:
+            data = await pipe.get(session_key)
+            pipe.multi()
+            pipe.rpush(history_key, *payloads)
+            pipe.expire(history_key, ttl_seconds)
+            if data:
+                session = Session.from_json(data)
+                session.increment_messages(delta)
+                queue_session_write(pipe, session, ttl_seconds)
+
+        results = await self._redis.transaction(append, session_key)
+        await self._trim_if_needed(history_key, results[0])
+
+        logger.debug(f"Appended {len(messages)} message(s) to session {session_id}")
+
+    async def append_and_get_context(
+        self,
+        session_id: str,
+        message: Message,
+        ttl_seconds: int,
+        max_messages: int | None = None,
+    ) -> list[Message]:
+        """
+        Append a message and return the context that precedes it, in one round-trip.
+
+        Args:
+            session_id: Session identifier
+            message: Message to append
+            ttl_seconds: TTL for the history key
+            max_messages: Maximum messages for context, including the appended one
+
+        Returns:
+            Prior Message objects for LLM input (excluding the appended message)
+        """
+        message.session_id = session_id
+        key = RedisKeys.session_history(session_id)
+        count = max_messages or self._max_messages
+
+        pipe = self._redis.client.pipeline(transaction=True)
+        pipe.rpush(key, message.to_json())
+        pipe.expire(key, ttl_seconds)
+        pipe.lrange(key, -count, -2)
+        length, _, data = await pipe.execute()
+
+        if length > self._max_messages:
+            await self._trim_if_needed(key, length)
+            # Only return what is still stored, so the next turn sees the same prefix
+            keep = self._max_messages - self._trim_buffer - 1
+            data = data[-keep:] if keep > 0 else []
+
+        return [Message.from_json(item) for item in data]
+
     async def get_history(
         self,
         session_id: str,
@@ -80,6 +211,68 @@ class ChatHistoryService:
         messages = [Message.from_json(item) for item in data]
         return messages
 
+    async def get_history_page(
+        self,
+        session_id: str,
+        limit: int,
+        session_ttl_seconds: int,
+        offset: int = 0,
+    ) -> tuple[list[Message], int] | None:
+        """
+        Retrieve a page of history together with the total count.
+
+        The session existence check rides in the same round-trip and, like
+        SessionManager.get_session, refreshes the session TTL on access.
+
+        Args:
+            session_id: Session identifier
+            limit: Maximum messages to return
+            session_ttl_seconds: TTL to refresh on the session key
+            offset: Number of messages to skip from start
+
+        Returns:
+            Tuple of (messages, total message count), or None if session not found
+        """
+        key = RedisKeys.session_history(session_id)
+
+        # Existence check + TTL refresh (EXPIRE returns 0 for a missing key),
+        # page and count in one round-trip
+        pipe = self._redis.client.pipeline(transaction=False)
+        pipe.expire(RedisKeys.session(session_id), session_ttl_seconds)
+        pipe.lrange(key, offset, offset + limit - 1)
+        pipe.llen(key)
+        exists, data, total = await pipe.execute()
+
+        if not exists:
+            return None
+
+        return [Message.from_json(item) for item in data], total
+
+    async def get_histories_bulk(
+        self,
+        session_ids: list[str],
+        limit: int,
+    ) -> list[list[Message]]:
+        """
+        Retrieve the first messages of several sessions in one round-trip.
+
+        Args:
+            session_ids: Session identifiers
+            limit: Maximum messages to return per session
+
+        Returns:
+            List of message lists, in the same order as session_ids
+        """
+        if not session_ids:
+            return []
+
+        pipe = self._redis.client.pipeline(transaction=False)
+        for session_id in session_ids:
+            pipe.lrange(RedisKeys.session_history(session_id), 0, limit - 1)
+        results = await pipe.execute()
+
+        return [[Message.from_json(item) for item in data] for data in results]
+
     async def get_history_count(self, session_id: str) -> int:
         """
         Get total message count in history.
@@ -123,6 +316,43 @@ class ChatHistoryService:
         await self._redis.client.delete(key)
         logger.info(f"Cleared history for session {session_id}")
 
+    async def clear_history_and_reset(self, session_id: str, ttl_seconds: int) -> bool:
+        """
+        Clear chat history and reset the session message count.
+
+        The session is read under WATCH, then the history delete and the
+        updated session write are committed together in one MULTI/EXEC.
+
+        Args:
+            session_id: Session identifier
+            ttl_seconds: TTL for the session key
+
+        Returns:
+            True if cleared, False if session not found
+        """
+        session_key = RedisKeys.session(session_id)
+
+        async def reset(pipe) -> bool:
+            data = await pipe.get(session_key)
+            if not data:
+                return False
+
+            session = Session.from_json(data)
+            session.message_count = 0
+            session.touch()
+
+            pipe.multi()
+            pipe.delete(RedisKeys.session_history(session_id))
+            queue_session_write(pipe, session, ttl_seconds)
+            pipe.incr(RedisKeys.search_generation())
+            return True
+
+        if not await self._redis.transaction(reset, session_key, value_from_callable=True):
+            return False
+
+        logger.info(f"Cleared history for session {session_id}")
+        return True
+
     async def get_context_messages(
         self,
         session_id: str,
@@ -160,28 +390,17 @@ class ChatHistoryService:
         """
         key = RedisKeys.session_history(session_id)
 
-        # Get all messages to find the target index
-        messages = await self.get_history(session_id)
-
-        # Find index of target message
-        target_index = None
-        for i, msg in enumerate(messages):
-            if msg.id == message_id:
-                target_index = i
-                break
+        # Find, trim and refresh TTL server-side in one round-trip
+        script = self._get_truncate_script()
+        target_index = int(
+            await script(
+                keys=[key, RedisKeys.search_generation()],
+                args=[message_id, ttl_seconds],
+            )
+        )
 
-        if target_index is None:
+        if target_index < 0:
             return None
 
-        # LTRIM keeps indices 0 to target_index - 1 (excludes target)
-        if target_index == 0:
-            # Removing first message means clear all
-            await self._redis.client.delete(key)
-            return 0
-        else:
-            async with self._redis.pipeline() as pipe:
-                await pipe.ltrim(key, 0, target_index - 1)
-                await pipe.expire(key, ttl_seconds)
-
         logger.debug(f"Truncated history for session {session_id} at message {message_id}")
         return target_index
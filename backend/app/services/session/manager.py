@@ -8,6 +8,22 @@ from app.redis.keys import RedisKeys
 
 logger = logging.getLogger(__name__)
 
+# Cap on the recency index; list_recent_sessions only reads the top entries
+RECENT_SESSIONS_INDEX_MAX = 1000
+
+
+def index_session(pipe, session: Session) -> None:
+    """Queue recency-index update for a session write on a pipeline."""
+    key = RedisKeys.recent_sessions()
+    pipe.zadd(key, {session.id: session.updated_at})
+    pipe.zremrangebyrank(key, 0, -(RECENT_SESSIONS_INDEX_MAX + 1))
+
+
+def queue_session_write(pipe, session: Session, ttl_seconds: int) -> None:
+    """Queue a session write (SETEX plus recency-index update) on a pipeline."""
+    pipe.setex(RedisKeys.session(session.id), ttl_seconds, session.to_json())
+    index_session(pipe, session)
+
 
 class SessionManager:
     """
@@ -43,12 +59,8 @@ class SessionManager:
             metadata=metadata,
         )
 
-        key = RedisKeys.session(session.id)
-        await self._redis.client.setex(
-            key,
-            self._ttl,
-            session.to_json(),
-        )
+        async with self._redis.pipeline(transaction=False) as pipe:
+            queue_session_write(pipe, session, self._ttl)
 
         logger.info(f"Created session {session.id}")
         return session
@@ -66,14 +78,17 @@ class SessionManager:
             Session object or None if not found
         """
         key = RedisKeys.session(session_id)
-        data = await self._redis.client.get(key)
+
+        # Read and refresh TTL on access in one round-trip (EXPIRE is a
+        # no-op for a missing key)
+        pipe = self._redis.client.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.expire(key, self._ttl)
+        data, _ = await pipe.execute()
 
         if not data:
             return None
 
-        # Refresh TTL on access
-        await self._redis.client.expire(key, self._ttl)
-
         session = Session.from_json(data)
         return session
 
@@ -85,12 +100,8 @@ class SessionManager:
             session: Session object to update
         """
         session.touch()
-        key = RedisKeys.session(session.id)
-        await self._redis.client.setex(
-            key,
-            self._ttl,
-            session.to_json(),
-        )
+        async with self._redis.pipeline(transaction=False) as pipe:
+            queue_session_write(pipe, session, self._ttl)
 
     async def delete_session(self, session_id: str) -> bool:
         """
@@ -105,7 +116,12 @@ class SessionManager:
         session_key = RedisKeys.session(session_id)
         history_key = RedisKeys.session_history(session_id)
 
-        deleted = await self._redis.client.delete(session_key, history_key)
+        pipe = self._redis.client.pipeline(transaction=False)
+        pipe.delete(session_key, history_key)
+        pipe.zrem(RedisKeys.recent_sessions(), session_id)
+        # Cached search results may contain this session's messages
+        pipe.incr(RedisKeys.search_generation())
+        deleted, _, _ = await pipe.execute()
 
         if deleted > 0:
             logger.info(f"Deleted session {session_id}")
@@ -139,7 +155,10 @@ class SessionManager:
         """
         List recent sessions, sorted by updated_at descending.
 
-        Uses SCAN to find session keys and retrieves their data.
+        Reads the recency index (sorted set by updated_at) and fetches the
+        top sessions with one MGET. Until the index has been backfilled once
+        (marker key), falls back to a SCAN of session keys that rebuilds it,
+        so sessions created before the index existed are not missed.
 
         Args:
             limit: Maximum number of sessions to return
@@ -147,6 +166,44 @@ class SessionManager:
         Returns:
             List of Session objects, most recently updated first
         """
+        index_key = RedisKeys.recent_sessions()
+
+        # Over-fetch so entries of expired sessions can be skipped
+        pipe = self._redis.client.pipeline(transaction=False)
+        pipe.exists(RedisKeys.recent_sessions_backfilled())
+        pipe.zrevrange(index_key, 0, limit * 2 - 1)
+        backfilled, session_ids = await pipe.execute()
+        if not backfilled:
+            return await self._scan_recent_sessions(limit)
+        if not session_ids:
+            return []
+
+        values = await self._redis.client.mget(
+            [RedisKeys.session(session_id) for session_id in session_ids]
+        )
+
+        sessions: list[Session] = []
+        stale: list[str] = []
+        for session_id, data in zip(session_ids, values, strict=True):
+            if not data:
+                # Session expired or was removed; drop it from the index
+                stale.append(session_id)
+                continue
+            try:
+                sessions.append(Session.from_json(data))
+            except Exception as e:
+                logger.warning(f"Failed to parse session {session_id}: {e}")
+
+        if stale:
+            await self._redis.client.zrem(index_key, *stale)
+
+        # Index order follows updated_at already; sort guards against stale scores
+        sessions.sort(key=lambda s: s.updated_at, reverse=True)
+
+        return sessions[:limit]
+
+    async def _scan_recent_sessions(self, limit: int) -> list[Session]:
+        """List recent sessions by scanning keys, rebuilding the recency index."""
         sessions: list[Session] = []
         cursor = 0
         pattern = RedisKeys.session("*")
@@ -158,8 +215,9 @@ class SessionManager:
                 count=100,
             )
 
-            for key in keys:
-                data = await self._redis.client.get(key)
+            # One round-trip per SCAN page instead of per key
+            values = await self._redis.client.mget(keys) if keys else []
+            for key, data in zip(keys, values, strict=True):
                 if data:
                     try:
                         session = Session.from_json(data)
@@ -170,11 +228,21 @@ class SessionManager:
             if cursor == 0:
                 break
 
-            # Early exit if we have way more than needed
-            if len(sessions) > limit * 2:
-                break
-
         # Sort by updated_at descending
-        sessions.sort(key=lambda s: s.updated_at_datetime, reverse=True)
+        sessions.sort(key=lambda s: s.updated_at, reverse=True)
+
+        # Rebuild the index (capped like index_session) and mark it backfilled
+        index_key = RedisKeys.recent_sessions()
+        async with self._redis.pipeline(transaction=False) as pipe:
+            if sessions:
+                pipe.zadd(
+                    index_key,
+                    {
+                        session.id: session.updated_at
+                        for session in sessions[:RECENT_SESSIONS_INDEX_MAX]
+                    },
+                )
+                pipe.zremrangebyrank(index_key, 0, -(RECENT_SESSIONS_INDEX_MAX + 1))
+            pipe.set(RedisKeys.recent_sessions_backfilled(), 1)
 
         return sessions[:limit]
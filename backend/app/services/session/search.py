@@ -1,12 +1,20 @@
 """Search service for conversation history with filtering and highlighting."""
 
+import hashlib
 import re
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+import orjson
+
 from app.models.domain.message import Message
+from app.redis.client import RedisClient
+from app.redis.keys import RedisKeys
+
+# Search response pages are cached briefly so repeated queries skip the search
+SEARCH_CACHE_TTL_SECONDS = 30
 
 
 class MessageType(str, Enum):
@@ -101,6 +109,21 @@ class SearchService:
             if not self._matches_filters(msg, filter_):
                 continue
 
+            # Content flags: scan up front only when filtering on them, and reuse
+            # that result; otherwise scan only messages that made it into the results
+            content = msg.content or ""
+            has_images: bool | None = None
+            if filter_.has_images is not None:
+                has_images = bool(self.IMAGE_PATTERN.search(content))
+                if filter_.has_images != has_images:
+                    continue
+
+            has_code: bool | None = None
+            if filter_.has_code is not None:
+                has_code = bool(self.CODE_PATTERN.search(content))
+                if filter_.has_code != has_code:
+                    continue
+
             # Calculate relevance and get highlights
             relevance, highlights = self._calculate_relevance(
                 msg.content, msg.thought, filter_.query
@@ -109,15 +132,17 @@ class SearchService:
             if filter_.query and relevance == 0:
                 continue  # Query specified but no match
 
-            has_images = bool(self.IMAGE_PATTERN.search(msg.content or ""))
-            has_code = bool(self.CODE_PATTERN.search(msg.content or ""))
+            if has_images is None:
+                has_images = bool(self.IMAGE_PATTERN.search(content))
+            if has_code is None:
+                has_code = bool(self.CODE_PATTERN.search(content))
 
             matches.append(
                 SearchMatch(
                     message_id=msg.id,
                     session_id=msg.session_id or "",
                     role=msg.role,
-                    content=msg.content or "",
+                    content=content,
                     thought=msg.thought,
                     created_at=msg.created_at_datetime.isoformat() if msg.created_at else "",
                     match_highlights=highlights,
@@ -147,7 +172,7 @@ class SearchService:
         )
 
     def _matches_filters(self, msg: Message, filter_: SearchFilter) -> bool:
-        """Check if message matches all filter criteria."""
+        """Check if message matches the role, session and date filter criteria."""
         # Message type filter
         if filter_.message_type != MessageType.ALL:
             if msg.role != filter_.message_type.value:
@@ -165,18 +190,6 @@ class SearchService:
             if filter_.date_to and msg_datetime > filter_.date_to:
                 return False
 
-        # Has images filter
-        if filter_.has_images is not None:
-            has_images = bool(self.IMAGE_PATTERN.search(msg.content or ""))
-            if filter_.has_images != has_images:
-                return False
-
-        # Has code filter
-        if filter_.has_code is not None:
-            has_code = bool(self.CODE_PATTERN.search(msg.content or ""))
-            if filter_.has_code != has_code:
-                return False
-
         return True
 
     def _calculate_relevance(
@@ -275,8 +288,8 @@ class SearchService:
                     "message_id": m.message_id,
                     "session_id": m.session_id,
                     "role": m.role,
-                    "content": m.content[:500] if len(m.content) > 500 else m.content,
-                    "thought": m.thought[:200] if m.thought and len(m.thought) > 200 else m.thought,
+                    "content": m.content[:500],
+                    "thought": m.thought and m.thought[:200],
                     "created_at": m.created_at,
                     "highlights": m.match_highlights,
                     "relevance": round(m.relevance_score, 3),
@@ -293,3 +306,62 @@ class SearchService:
             },
             "query": result.query,
         }
+
+
+class SearchCache:
+    """
+    Short-lived Redis cache of serialized search response pages.
+
+    Entries are stamped with the search generation, which is bumped whenever
+    history is deleted or rewritten, so an entry written before a delete,
+    clear or truncate is never served.
+    """
+
+    def __init__(self, redis: RedisClient, ttl_seconds: int = SEARCH_CACHE_TTL_SECONDS):
+        self._redis = redis
+        self._ttl = ttl_seconds
+
+    @staticmethod
+    def key_for(params: dict[str, Any]) -> str:
+        """Cache key for a search request (all filter and paging params)."""
+        digest = hashlib.blake2b(
+            orjson.dumps(params, option=orjson.OPT_SORT_KEYS),
+            digest_size=16,
+        ).hexdigest()
+        return RedisKeys.search_cache(digest)
+
+    async def get(self, key: str) -> tuple[str | None, str]:
+        """
+        Look up a cached page.
+
+        Returns:
+            Tuple of (cached body or None, current generation). Pass the
+            generation back to set() so a concurrent invalidation wins.
+        """
+        pipe = self._redis.client.pipeline(transaction=False)
+        pipe.get(RedisKeys.search_generation())
+        pipe.hmget(key, "generation", "body")
+        generation, (cached_generation, body) = await pipe.execute()
+
+        generation = generation or "0"
+        if body is None or cached_generation != generation:
+            return None, generation
+        return body, generation
+
+    async def set(self, key: str, body: bytes, generation: str) -> None:
+        """Store a serialized page stamped with the generation it was built at."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping={"generation": generation, "body": body})
+            pipe.expire(key, self._ttl)
+
+
+# Global search service singleton (stateless)
+_search_service: SearchService | None = None
+
+
+def get_search_service() -> SearchService:
+    """Get the global search service."""
+    global _search_service
+    if _search_service is None:
+        _search_service = SearchService()
+    return _search_service